@@ -30,6 +30,10 @@ def run_add(refs: list[str], overwrite: bool = False) -> None:
         config = AgrConfig()
     else:
         config = AgrConfig.load(config_path)
+        for dup in config.duplicates:
+            console.print(
+                f"[yellow]Warning:[/yellow] Duplicate dependency in agr.toml: {dup.identifier}"
+            )
 
     # Get configured tools
     tools = config.get_tools()
@@ -29,6 +29,11 @@ def run_remove(refs: list[str]) -> None:
 
     config = AgrConfig.load(config_path)
 
+    for dup in config.duplicates:
+        console.print(
+            f"[yellow]Warning:[/yellow] Duplicate dependency in agr.toml: {dup.identifier}"
+        )
+
     # Get configured tools
     tools = config.get_tools()
 
@@ -1,18 +1,27 @@
 """agr sync command implementation."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from rich.console import Console
 
-from agr.config import AgrConfig, find_config, find_repo_root
+from agr.config import AgrConfig, Dependency, find_config, find_repo_root
 from agr.exceptions import AgrError
-from agr.fetcher import fetch_and_install_to_tools, is_skill_installed
+from agr.fetcher import (
+    downloaded_repo,
+    ensure_writable,
+    fetch_and_install_to_tools,
+    is_skill_installed,
+)
 from agr.handle import INSTALLED_NAME_SEPARATOR, LEGACY_SEPARATOR, parse_handle
 from agr.skill import SKILL_MARKER
 from agr.tool import ToolConfig
 
 console = Console()
 
+# Cap on concurrent sync tasks, to stay clear of GitHub secondary rate limits
+MAX_SYNC_WORKERS = 8
+
 
 def _migrate_legacy_directories(skills_dir: Path, tool: ToolConfig) -> None:
     """Migrate colon-based directory names to the new separator format.
@@ -59,6 +68,187 @@ def _migrate_legacy_directories(skills_dir: Path, tool: ToolConfig) -> None:
             console.print(f"  [dim]{e}[/dim]")
 
 
+def _sync_dependency(
+    dep: Dependency,
+    repo_root: Path,
+    tools: list[ToolConfig],
+    repo_dir: Path | None = None,
+) -> tuple[str, str, str | None]:
+    """Install a single dependency into every tool that is missing it.
+
+    Args:
+        dep: Dependency from agr.toml
+        repo_root: Repository root path
+        tools: Configured tools to install into
+        repo_dir: Already downloaded repository for a remote dependency
+
+    Returns:
+        Tuple of (identifier, status, message) where status is one of
+        "installed", "up-to-date" or "error". The message names the tools
+        installed into, or gives the error; it is None when up to date.
+    """
+    identifier = dep.identifier
+
+    try:
+        # Parse handle
+        if dep.is_local:
+            ref = dep.path or ""
+        else:
+            ref = dep.handle or ""
+
+        handle = parse_handle(ref)
+
+        # Get tools that need installation
+        tools_needing_install = [
+            tool for tool in tools if not is_skill_installed(handle, repo_root, tool)
+        ]
+
+        if not tools_needing_install:
+            return identifier, "up-to-date", None
+
+        # Install to all tools that need it (downloads once)
+        installed = fetch_and_install_to_tools(
+            handle, repo_root, tools_needing_install, overwrite=False, repo_dir=repo_dir
+        )
+
+        return identifier, "installed", ", ".join(installed)
+
+    except FileExistsError as e:
+        return identifier, "error", str(e)
+    except AgrError as e:
+        return identifier, "error", str(e)
+    except Exception as e:
+        return identifier, "error", f"Unexpected: {e}"
+
+
+def _github_repo(dep: Dependency) -> tuple[str, str] | None:
+    """Get the (username, repo) a remote dependency is fetched from.
+
+    Returns:
+        The GitHub repository, or None if the handle doesn't parse
+    """
+    try:
+        return parse_handle(dep.handle or "").get_github_repo()
+    except AgrError:
+        return None
+
+
+def _group_key(dep: Dependency) -> tuple[str, ...] | None:
+    """Key for dependencies that must be synced together in one task.
+
+    Remote dependencies from one GitHub repository share a download. Local
+    dependencies with the same skill name install to the same directory,
+    so they run one after another instead of racing.
+
+    Returns:
+        Group key, or None if the dependency's handle doesn't parse
+    """
+    if not dep.is_local:
+        repo = _github_repo(dep)
+        return ("remote", *repo) if repo else None
+    try:
+        return ("local", parse_handle(dep.path or "").name)
+    except AgrError:
+        return None
+
+
+def _sync_group(
+    deps: list[Dependency], repo_root: Path, tools: list[ToolConfig]
+) -> list[tuple[str, str, str | None]]:
+    """Sync a group of dependencies that share a _group_key.
+
+    Local dependencies are installed in order. For remote dependencies the
+    shared repository is downloaded at most once, and only when one of them
+    is missing from some tool.
+
+    Args:
+        deps: Dependencies with the same group key
+        repo_root: Repository root path
+        tools: Configured tools to install into
+
+    Returns:
+        One (identifier, status, message) tuple per dependency, in order
+    """
+    repo = None if deps[0].is_local else _github_repo(deps[0])
+    if repo is None:
+        return [_sync_dependency(dep, repo_root, tools) for dep in deps]
+
+    # Deps already in every tool are settled before downloading, so a
+    # failed download only reports the ones that needed it
+    results: dict[int, tuple[str, str, str | None]] = {}
+    target_tools: dict[str, ToolConfig] = {}
+    for index, dep in enumerate(deps):
+        handle = parse_handle(dep.handle or "")
+        needing = [t for t in tools if not is_skill_installed(handle, repo_root, t)]
+        if needing:
+            target_tools.update((tool.name, tool) for tool in needing)
+        else:
+            results[index] = (dep.identifier, "up-to-date", None)
+    missing = [index for index in range(len(deps)) if index not in results]
+
+    if missing:
+        try:
+            # Fail on unwritable targets before spending the download
+            for tool in target_tools.values():
+                ensure_writable(tool.get_skills_dir(repo_root))
+            with downloaded_repo(*repo) as repo_dir:
+                for index in missing:
+                    results[index] = _sync_dependency(
+                        deps[index], repo_root, tools, repo_dir
+                    )
+        except AgrError as e:
+            for index in missing:
+                results.setdefault(index, (deps[index].identifier, "error", str(e)))
+        except Exception as e:
+            for index in missing:
+                results.setdefault(
+                    index, (deps[index].identifier, "error", f"Unexpected: {e}")
+                )
+
+    return [results[index] for index in range(len(deps))]
+
+
+def sync_dependencies(
+    deps: list[Dependency], repo_root: Path, tools: list[ToolConfig]
+) -> list[tuple[str, str, str | None]]:
+    """Install dependencies into every tool that is missing them.
+
+    Installs are I/O-bound (downloads for remote deps, file copies for
+    local ones), so independent groups run concurrently on a thread pool,
+    and each GitHub repository is downloaded at most once.
+
+    Args:
+        deps: Dependencies to sync
+        repo_root: Repository root path
+        tools: Tools to install into
+
+    Returns:
+        One (identifier, status, message) tuple per dependency, in the order
+        given, as returned by _sync_dependency.
+    """
+    if not deps:
+        return []
+
+    groups: dict[object, list[int]] = {}
+    for index, dep in enumerate(deps):
+        # Unparseable handles get their own group so they report alone
+        key = _group_key(dep) or index
+        groups.setdefault(key, []).append(index)
+
+    by_index: dict[int, tuple[str, str, str | None]] = {}
+    with ThreadPoolExecutor(max_workers=min(MAX_SYNC_WORKERS, len(groups))) as pool:
+        pending = {
+            pool.submit(
+                _sync_group, [deps[i] for i in indices], repo_root, tools
+            ): indices
+            for indices in groups.values()
+        }
+        for future, indices in pending.items():
+            by_index.update(zip(indices, future.result()))
+
+    return [by_index[index] for index in range(len(deps))]
+
+
 def run_sync() -> None:
     """Run the sync command.
 
@@ -80,6 +270,11 @@ def run_sync() -> None:
 
     config = AgrConfig.load(config_path)
 
+    for dup in config.duplicates:
+        console.print(
+            f"[yellow]Warning:[/yellow] Duplicate dependency in agr.toml: {dup.identifier}"
+        )
+
     # Get configured tools
     tools = config.get_tools()
 
@@ -92,57 +287,14 @@ def run_sync() -> None:
         console.print("[yellow]No dependencies in agr.toml.[/yellow] Nothing to sync.")
         return
 
-    # Track results per dependency (not per tool)
-    results: list[tuple[str, str, str | None]] = []  # (identifier, status, error)
-
-    for dep in config.dependencies:
-        identifier = dep.identifier
-
-        try:
-            # Parse handle
-            if dep.is_local:
-                ref = dep.path or ""
-            else:
-                ref = dep.handle or ""
-
-            handle = parse_handle(ref)
-
-            # Check if already installed in all tools
-            all_installed = all(
-                is_skill_installed(handle, repo_root, tool) for tool in tools
-            )
-
-            if all_installed:
-                results.append((identifier, "up-to-date", None))
-                continue
-
-            # Get tools that need installation
-            tools_needing_install = [
-                tool
-                for tool in tools
-                if not is_skill_installed(handle, repo_root, tool)
-            ]
-
-            # Install to all tools that need it (downloads once)
-            fetch_and_install_to_tools(
-                handle, repo_root, tools_needing_install, overwrite=False
-            )
-
-            results.append((identifier, "installed", None))
-
-        except FileExistsError as e:
-            results.append((identifier, "error", str(e)))
-        except AgrError as e:
-            results.append((identifier, "error", str(e)))
-        except Exception as e:
-            results.append((identifier, "error", f"Unexpected: {e}"))
+    results = sync_dependencies(config.dependencies, repo_root, tools)
 
     # Print results
     installed = 0
     up_to_date = 0
     errors = 0
 
-    for identifier, status, error in results:
+    for identifier, status, message in results:
         if status == "installed":
             console.print(f"[green]Installed:[/green] {identifier}")
             installed += 1
@@ -151,8 +303,8 @@ def run_sync() -> None:
             up_to_date += 1
         else:
             console.print(f"[red]Error:[/red] {identifier}")
-            if error:
-                console.print(f"  [dim]{error}[/dim]")
+            if message:
+                console.print(f"  [dim]{message}[/dim]")
             errors += 1
 
     # Summary
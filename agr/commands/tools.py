@@ -4,10 +4,8 @@ import shutil
 
 from rich.console import Console
 
+from agr.commands.sync import sync_dependencies
 from agr.config import AgrConfig, find_config, find_repo_root
-from agr.exceptions import AgrError
-from agr.fetcher import fetch_and_install_to_tools, is_skill_installed
-from agr.handle import parse_handle
 from agr.tool import DEFAULT_TOOL_NAMES, TOOLS
 
 console = Console()
@@ -78,6 +76,11 @@ def run_tools_add(tool_names: list[str]) -> None:
 
     config = AgrConfig.load(config_path)
 
+    for dup in config.duplicates:
+        console.print(
+            f"[yellow]Warning:[/yellow] Duplicate dependency in agr.toml: {dup.identifier}"
+        )
+
     # Add tools (skip duplicates)
     added: list[str] = []
     skipped: list[str] = []
@@ -119,41 +122,15 @@ def run_tools_add(tool_names: list[str]) -> None:
         new_tools = [TOOLS[name] for name in added]
         sync_errors = 0
 
-        for dep in config.dependencies:
-            try:
-                # Parse handle
-                if dep.is_local:
-                    ref = dep.path or ""
-                else:
-                    ref = dep.handle or ""
-
-                handle = parse_handle(ref)
-
-                # Check which new tools need installation
-                tools_needing_install = [
-                    tool
-                    for tool in new_tools
-                    if not is_skill_installed(handle, repo_root, tool)
-                ]
-
-                if not tools_needing_install:
-                    continue
-
-                # Install to new tools
-                fetch_and_install_to_tools(
-                    handle, repo_root, tools_needing_install, overwrite=False
-                )
-
-                tool_list = ", ".join(t.name for t in tools_needing_install)
-                console.print(
-                    f"[green]Installed:[/green] {dep.identifier} ({tool_list})"
-                )
-
-            except AgrError as e:
-                console.print(f"[red]Error:[/red] {dep.identifier}: {e}")
-                sync_errors += 1
-            except Exception as e:
-                console.print(f"[red]Error:[/red] {dep.identifier}: {e}")
+        # Shares sync's worker pool and per-repository download grouping.
+        # For installs the message lists the tools actually installed into.
+        for identifier, status, message in sync_dependencies(
+            config.dependencies, repo_root, new_tools
+        ):
+            if status == "installed":
+                console.print(f"[green]Installed:[/green] {identifier} ({message})")
+            elif status == "error":
+                console.print(f"[red]Error:[/red] {identifier}: {message}")
                 sync_errors += 1
 
         # Save config after successful sync
@@ -182,6 +159,11 @@ def run_tools_remove(tool_names: list[str]) -> None:
 
     config = AgrConfig.load(config_path)
 
+    for dup in config.duplicates:
+        console.print(
+            f"[yellow]Warning:[/yellow] Duplicate dependency in agr.toml: {dup.identifier}"
+        )
+
     # Check if removing would leave no tools
     remaining = [t for t in config.tools if t not in tool_names]
     if not remaining:
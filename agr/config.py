@@ -1,5 +1,7 @@
 """Configuration management for agr.toml."""
 
+import os
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -10,8 +12,19 @@ from tomlkit.exceptions import TOMLKitError
 from agr.exceptions import ConfigError
 from agr.tool import DEFAULT_TOOL_NAMES, TOOLS, ToolConfig, get_tool
 
+# Reading only needs plain data, so use the stdlib parser where available;
+# tomlkit's style-preserving document model is kept for writing.
+if sys.version_info >= (3, 11):
+    import tomllib
 
-@dataclass
+    _parse_toml = tomllib.loads
+    _TOML_ERRORS: tuple[type[Exception], ...] = (tomllib.TOMLDecodeError,)
+else:
+    _parse_toml = tomlkit.parse
+    _TOML_ERRORS = (TOMLKitError,)
+
+
+@dataclass(frozen=True, slots=True)
 class Dependency:
     """A dependency in agr.toml.
 
@@ -46,6 +59,16 @@ class Dependency:
         """Unique identifier (path or handle)."""
         return self.path or self.handle or ""
 
+    def matches(self, identifier: str) -> bool:
+        """Check whether identifier refers to this dependency.
+
+        Local paths are compared normalized, so "./my-skill" and "my-skill"
+        find the same entry; load() keeps only one of such spellings.
+        """
+        if self.path is not None:
+            return os.path.normpath(self.path) == os.path.normpath(identifier)
+        return self.handle == identifier
+
 
 @dataclass
 class AgrConfig:
@@ -61,6 +84,9 @@ class AgrConfig:
 
     dependencies: list[Dependency] = field(default_factory=list)
     tools: list[str] = field(default_factory=lambda: list(DEFAULT_TOOL_NAMES))
+    # Entries load() dropped as repeats of an earlier one; commands warn
+    # about them since save() writes the file back without them
+    duplicates: list[Dependency] = field(default_factory=list)
     _path: Path | None = field(default=None, repr=False)
 
     def get_tools(self) -> list[ToolConfig]:
@@ -85,17 +111,20 @@ class AgrConfig:
             AgrConfig instance
 
         Raises:
-            ConfigError: If the file contains invalid TOML
+            ConfigError: If the path is not a file or contains invalid TOML
         """
         if not path.exists():
             config = cls()
             config._path = path
             return config
 
+        if not path.is_file():
+            raise ConfigError(f"{path} is not a file")
+
         try:
             content = path.read_text()
-            doc = tomlkit.parse(content)
-        except TOMLKitError as e:
+            doc = _parse_toml(content)
+        except _TOML_ERRORS as e:
             raise ConfigError(f"Invalid TOML in {path}: {e}")
 
         config = cls()
@@ -116,7 +145,9 @@ class AgrConfig:
                     f"Unknown tool '{tool_name}' in agr.toml. Available: {available}"
                 )
 
-        # Parse dependencies list
+        # Parse dependencies list, keeping the first of any duplicate entries
+        # so the same skill is never installed twice in one run
+        deps: dict[tuple[str, str], Dependency] = {}
         deps_list = doc.get("dependencies", [])
         for item in deps_list:
             if not isinstance(item, dict):
@@ -126,10 +157,19 @@ class AgrConfig:
             path_val = item.get("path")
 
             if handle:
-                config.dependencies.append(Dependency(handle=handle, type=dep_type))
+                key = (dep_type, handle)
+                dep = Dependency(handle=handle, type=dep_type)
             elif path_val:
-                config.dependencies.append(Dependency(path=path_val, type=dep_type))
+                key = (dep_type, os.path.normpath(path_val))
+                dep = Dependency(path=path_val, type=dep_type)
+            else:
+                continue
+            if key in deps:
+                config.duplicates.append(dep)
+            else:
+                deps[key] = dep
 
+        config.dependencies = list(deps.values())
         return config
 
     def save(self, path: Path | None = None) -> None:
@@ -177,7 +217,7 @@ class AgrConfig:
         If a dependency with the same identifier exists, it's replaced.
         """
         self.dependencies = [
-            d for d in self.dependencies if d.identifier != dep.identifier
+            d for d in self.dependencies if not d.matches(dep.identifier)
         ]
         self.dependencies.append(dep)
 
@@ -188,13 +228,13 @@ class AgrConfig:
             True if removed, False if not found
         """
         original_len = len(self.dependencies)
-        self.dependencies = [d for d in self.dependencies if d.identifier != identifier]
+        self.dependencies = [d for d in self.dependencies if not d.matches(identifier)]
         return len(self.dependencies) < original_len
 
     def get_by_identifier(self, identifier: str) -> Dependency | None:
         """Find a dependency by handle or path."""
         for dep in self.dependencies:
-            if dep.identifier == identifier:
+            if dep.matches(identifier):
                 return dep
         return None
 
@@ -27,3 +27,7 @@ class InvalidHandleError(AgrError):
 
 class InvalidLocalPathError(AgrError):
     """Raised when a local skill path is invalid."""
+
+
+class InstallPermissionError(AgrError):
+    """Raised when the skills directory cannot be written to."""
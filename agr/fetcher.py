@@ -1,19 +1,21 @@
 """GitHub download and skill installation."""
 
+import atexit
+import io
 import logging
 import os
 import shutil
-import tarfile
 import tempfile
-from contextlib import contextmanager
+import threading
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
-from typing import Generator
-
-import httpx
+from typing import TYPE_CHECKING, Generator
 
 from agr.exceptions import (
     AgrError,
     AuthenticationError,
+    InstallPermissionError,
+    InvalidLocalPathError,
     RepoNotFoundError,
     SkillNotFoundError,
 )
@@ -26,8 +28,91 @@ from agr.skill import (
 )
 from agr.tool import DEFAULT_TOOL, ToolConfig
 
+if TYPE_CHECKING:
+    import tarfile
+
+    import httpx
+
 logger = logging.getLogger(__name__)
 
+_client: "httpx.Client | None" = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> "httpx.Client":
+    """Get the shared HTTP client, creating it on first use.
+
+    A single client keeps one connection pool for the whole process, so
+    concurrent and back-to-back downloads reuse open TLS connections to
+    GitHub instead of handshaking for every repository.
+
+    Returns:
+        Process-wide httpx.Client
+    """
+    # httpx and tarfile are imported on first download so commands that
+    # never touch the network (list, init, remove, --help) don't load them
+    import httpx
+
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = httpx.Client(
+                follow_redirects=True,
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+                transport=httpx.HTTPTransport(retries=3),
+            )
+            atexit.register(_client.close)
+        return _client
+
+
+class _ResponseReader(io.RawIOBase):
+    """Read-only file object over a streaming httpx response body.
+
+    Lets tarfile consume the archive in stream mode while it downloads.
+    """
+
+    def __init__(self, response: "httpx.Response") -> None:
+        self._chunks = response.iter_bytes()
+        self._buffer = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        while not self._buffer:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._buffer = memoryview(chunk)
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+
+_RATE_LIMIT_MESSAGE = (
+    "GitHub rate limit exceeded. Set GITHUB_TOKEN for higher limits "
+    "or wait before retrying."
+)
+
+# Download responses mapped to (error class, message with a token set,
+# message without one). 404 is handled separately as it names the repo.
+_STATUS_ERRORS: dict[int, tuple[type[AgrError], str, str]] = {
+    401: (
+        AuthenticationError,
+        "Authentication failed. Check that GITHUB_TOKEN is valid.",
+        "Authentication required. Set GITHUB_TOKEN to access this repository.",
+    ),
+    403: (
+        AuthenticationError,
+        "Access denied. Check that GITHUB_TOKEN has 'repo' scope "
+        "for private repositories.",
+        "Access denied. Set GITHUB_TOKEN to access private repositories.",
+    ),
+    429: (AgrError, _RATE_LIMIT_MESSAGE, _RATE_LIMIT_MESSAGE),
+}
+
 
 def _get_github_token() -> str | None:
     """Get GitHub token from environment.
@@ -44,6 +129,65 @@ def _get_github_token() -> str | None:
     return None
 
 
+def _is_within(path: str, root: str) -> bool:
+    """Check whether path, with symlinks resolved, lies inside root.
+
+    Args:
+        path: Path to check
+        root: Already-resolved directory it must stay inside
+    """
+    resolved = os.path.realpath(path)
+    return resolved == root or resolved.startswith(root + os.sep)
+
+
+def _extract_all(tar: "tarfile.TarFile", dest: Path) -> None:
+    """Extract every member of a tarball into dest, refusing unsafe members.
+
+    Uses tarfile's "data" filter where available. Older patch releases of
+    Python 3.10/3.11 lack extraction filters, so equivalent checks are
+    applied here instead. Paths are resolved against what has already been
+    extracted, so chains of symlinks can't be used to climb out of dest.
+
+    Args:
+        tar: Open tarball (stream mode is fine)
+        dest: Directory to extract into
+
+    Raises:
+        tarfile.TarError: If a member would be written outside dest or is
+            not a regular file, directory or link
+    """
+    import tarfile
+
+    if hasattr(tarfile, "data_filter"):
+        tar.extractall(dest, filter="data")
+        return
+
+    dest.mkdir(parents=True, exist_ok=True)
+    root = os.path.realpath(dest)
+    for member in tar:
+        location = os.path.join(root, member.name)
+        if member.issym():
+            # Symlink targets are relative to the link's own directory
+            target = os.path.join(os.path.dirname(location), member.linkname)
+        elif member.islnk():
+            target = os.path.join(root, member.linkname)
+        elif member.isreg() or member.isdir():
+            target = location
+        else:
+            raise tarfile.TarError(f"Refusing to extract special file {member.name!r}")
+        # The member itself is checked by its parent directory, so a symlink
+        # member isn't judged by where it will point once created
+        if (
+            os.path.isabs(member.name)
+            or not _is_within(os.path.dirname(location), root)
+            or not _is_within(target, root)
+        ):
+            raise tarfile.TarError(
+                f"Refusing to extract {member.name!r} outside {dest}"
+            )
+        tar.extract(member, dest)
+
+
 @contextmanager
 def downloaded_repo(username: str, repo_name: str) -> Generator[Path, None, None]:
     """Download a GitHub repo tarball and yield the extracted directory.
@@ -60,54 +204,47 @@ def downloaded_repo(username: str, repo_name: str) -> Generator[Path, None, None
         AuthenticationError: If authentication fails (private repo without valid token)
         AgrError: If download or extraction fails
     """
-    tarball_url = (
-        f"https://github.com/{username}/{repo_name}/archive/refs/heads/main.tar.gz"
-    )
+    import tarfile
+
+    import httpx
+
+    # Build headers with optional auth
+    headers = {}
+    token = _get_github_token()
+    if token:
+        headers["Authorization"] = f"token {token}"
+        # Authenticated archive requests go through github.com, which
+        # redirects private repos to a signed codeload URL
+        tarball_url = (
+            f"https://github.com/{username}/{repo_name}/archive/refs/heads/main.tar.gz"
+        )
+    else:
+        # Public archives are served by codeload directly, skipping the
+        # github.com redirect hop
+        tarball_url = (
+            f"https://codeload.github.com/{username}/{repo_name}/tar.gz/refs/heads/main"
+        )
 
     with tempfile.TemporaryDirectory() as tmp_dir:
         tmp_path = Path(tmp_dir)
-        tarball_path = tmp_path / "repo.tar.gz"
+        extract_path = tmp_path / "extracted"
 
-        # Download tarball
+        # Download and extract the tarball in one streaming pass
         try:
-            # Build headers with optional auth
-            headers = {}
-            token = _get_github_token()
-            if token:
-                headers["Authorization"] = f"token {token}"
-
-            with httpx.Client(follow_redirects=True, timeout=30.0) as client:
-                response = client.get(tarball_url, headers=headers)
-                if response.status_code == 401:
-                    if token:
-                        raise AuthenticationError(
-                            "Authentication failed. Check that GITHUB_TOKEN is valid."
-                        )
-                    else:
-                        raise AuthenticationError(
-                            "Authentication required. Set GITHUB_TOKEN to access this repository."
-                        )
-                if response.status_code == 403:
-                    if token:
-                        raise AuthenticationError(
-                            "Access denied. Check that GITHUB_TOKEN has 'repo' scope "
-                            "for private repositories."
-                        )
-                    else:
-                        raise AuthenticationError(
-                            "Access denied. Set GITHUB_TOKEN to access private repositories."
-                        )
+            with _get_client().stream("GET", tarball_url, headers=headers) as response:
+                status_error = _STATUS_ERRORS.get(response.status_code)
+                if status_error is not None:
+                    error_cls, with_token, without_token = status_error
+                    raise error_cls(with_token if token else without_token)
                 if response.status_code == 404:
                     raise RepoNotFoundError(
                         f"Repository '{username}/{repo_name}' not found on GitHub"
                     )
-                if response.status_code == 429:
-                    raise AgrError(
-                        "GitHub rate limit exceeded. Set GITHUB_TOKEN for higher limits "
-                        "or wait before retrying."
-                    )
                 response.raise_for_status()
-                tarball_path.write_bytes(response.content)
+                with tarfile.open(
+                    fileobj=_ResponseReader(response), mode="r|gz"
+                ) as tar:
+                    _extract_all(tar, extract_path)
         except httpx.HTTPStatusError:
             # Don't include the original exception - it may contain auth headers
             raise AgrError(
@@ -116,11 +253,8 @@ def downloaded_repo(username: str, repo_name: str) -> Generator[Path, None, None
             ) from None
         except httpx.RequestError as e:
             raise AgrError(f"Network error: {type(e).__name__}") from None
-
-        # Extract tarball
-        extract_path = tmp_path / "extracted"
-        with tarfile.open(tarball_path, "r:gz") as tar:
-            tar.extractall(extract_path, filter="data")
+        except tarfile.TarError:
+            raise AgrError("Failed to extract repository") from None
 
         # GitHub tarballs extract to {repo}-{branch}/
         repo_dir = extract_path / f"{repo_name}-main"
@@ -135,12 +269,54 @@ def downloaded_repo(username: str, repo_name: str) -> Generator[Path, None, None
         yield repo_dir
 
 
+def ensure_writable(path: Path) -> None:
+    """Check up front that path can be created or written to.
+
+    Checks the nearest existing ancestor, since missing directories are
+    created on install. Failing here avoids partial installs to roll back
+    and, for remote skills, a wasted download.
+
+    Args:
+        path: Directory that an install will write into
+
+    Raises:
+        InstallPermissionError: If the location is not writable
+    """
+    existing = next((p for p in (path, *path.parents) if p.exists()), None)
+    if existing is not None and not os.access(existing, os.W_OK):
+        raise InstallPermissionError(f"Cannot write to {existing}: permission denied")
+
+
+def _link_or_copy(src: str, dst: str) -> str:
+    """Hardlink a file into place, copying it when linking isn't possible.
+
+    SKILL.md is always copied because it is rewritten per tool after
+    install, and a shared inode would leak one tool's name into another.
+    Linking fails across filesystems or where hardlinks are unsupported.
+
+    Args:
+        src: Source file path
+        dst: Destination file path
+
+    Returns:
+        The destination path, as shutil.copytree expects
+    """
+    if os.path.basename(src) != SKILL_MARKER:
+        try:
+            os.link(src, dst)
+            return dst
+        except OSError:
+            pass
+    return shutil.copy2(src, dst)
+
+
 def _copy_skill_to_destination(
     source: Path,
     dest: Path,
     handle: ParsedHandle,
     tool: ToolConfig,
     overwrite: bool,
+    link_files: bool = False,
 ) -> Path:
     """Copy skill source to destination with overwrite handling.
 
@@ -150,23 +326,30 @@ def _copy_skill_to_destination(
         handle: Parsed handle for naming
         tool: Tool configuration
         overwrite: Whether to overwrite existing
+        link_files: Hardlink files instead of copying them. Only safe when
+            the source is a throwaway extraction nobody edits.
 
     Returns:
         Path to installed skill
 
     Raises:
         FileExistsError: If skill exists and not overwriting
+        InstallPermissionError: If the destination is not writable
     """
     if dest.exists() and not overwrite:
         raise FileExistsError(
             f"Skill already exists at {dest}. Use --overwrite to replace."
         )
 
+    ensure_writable(dest.parent)
+
     if dest.exists():
         shutil.rmtree(dest)
 
     dest.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copytree(source, dest)
+    shutil.copytree(
+        source, dest, copy_function=_link_or_copy if link_files else shutil.copy2
+    )
 
     skill_name_for_tool = handle.get_skill_name_for_tool(tool)
     update_skill_md_name(dest, skill_name_for_tool)
@@ -181,6 +364,7 @@ def install_skill_from_repo(
     dest_dir: Path,
     tool: ToolConfig,
     overwrite: bool = False,
+    link_files: bool = False,
 ) -> Path:
     """Install a skill from a downloaded repository.
 
@@ -191,6 +375,9 @@ def install_skill_from_repo(
         dest_dir: Destination skills directory
         tool: Tool configuration for path structure
         overwrite: Whether to overwrite existing
+        link_files: Hardlink files out of repo_dir instead of copying. Only
+            for a temporary extraction, and only for one destination per
+            skill; otherwise installs would share (and co-edit) files.
 
     Returns:
         Path to installed skill
@@ -212,7 +399,9 @@ def install_skill_from_repo(
     skill_path = handle.to_skill_path(tool)
     skill_dest = dest_dir / skill_path
 
-    return _copy_skill_to_destination(skill_source, skill_dest, handle, tool, overwrite)
+    return _copy_skill_to_destination(
+        skill_source, skill_dest, handle, tool, overwrite, link_files=link_files
+    )
 
 
 def install_local_skill(
@@ -288,14 +477,19 @@ def fetch_and_install(
         if not source_path.is_absolute():
             source_path = (repo_root / source_path).resolve()
 
+        # One lstat reports a missing path before any skill validation
+        if not os.path.lexists(source_path):
+            raise InvalidLocalPathError(f"Path does not exist: {handle.local_path}")
+
         return install_local_skill(source_path, skills_dir, tool, overwrite)
 
     # Remote skill installation
     username, repo_name = handle.get_github_repo()
 
     with downloaded_repo(username, repo_name) as repo_dir:
+        # The extraction is deleted afterwards, so this install owns the links
         return install_skill_from_repo(
-            repo_dir, handle.name, handle, skills_dir, tool, overwrite
+            repo_dir, handle.name, handle, skills_dir, tool, overwrite, link_files=True
         )
 
 
@@ -304,6 +498,7 @@ def fetch_and_install_to_tools(
     repo_root: Path,
     tools: list[ToolConfig],
     overwrite: bool = False,
+    repo_dir: Path | None = None,
 ) -> dict[str, Path]:
     """Fetch skill once and install to multiple tools.
 
@@ -315,6 +510,11 @@ def fetch_and_install_to_tools(
         repo_root: Repository root path
         tools: List of tool configurations to install to
         overwrite: Whether to overwrite existing installations
+        repo_dir: Already extracted repository to install a remote handle
+            from, skipping the download (lets callers share one download
+            across several skills from the same repo). Files are always
+            copied out of it, since another handle may resolve to the same
+            skill directory in a shared extraction.
 
     Returns:
         Dict mapping tool name to installed path
@@ -350,15 +550,35 @@ def fetch_and_install_to_tools(
                 raise
         return installed
 
-    # Remote: download once, install to all
-    username, repo_name = handle.get_github_repo()
+    # Remote: fail on unwritable targets before spending a download
+    for tool in tools:
+        ensure_writable(tool.get_skills_dir(repo_root))
 
-    with downloaded_repo(username, repo_name) as repo_dir:
-        for tool in tools:
+    # Download once (unless provided), install to all
+    source = (
+        nullcontext(repo_dir)
+        if repo_dir is not None
+        else downloaded_repo(*handle.get_github_repo())
+    )
+
+    # Only an extraction owned by this call is safe to link from: a shared
+    # one may install the same skill again under an equivalent handle
+    link_first = repo_dir is None
+
+    with source as source_dir:
+        for index, tool in enumerate(tools):
             try:
                 skills_dir = tool.get_skills_dir(repo_root)
+                # Only the first tool links out of the extraction; the rest
+                # copy so tools never share an editable inode
                 path = install_skill_from_repo(
-                    repo_dir, handle.name, handle, skills_dir, tool, overwrite
+                    source_dir,
+                    handle.name,
+                    handle,
+                    skills_dir,
+                    tool,
+                    overwrite,
+                    link_files=link_first and index == 0,
                 )
                 installed[tool.name] = path
             except Exception:
@@ -448,12 +668,16 @@ def get_installed_skills(repo_root: Path, tool: ToolConfig = DEFAULT_TOOL) -> li
             skills.append(str(skill_path))
         return skills
     else:
-        # For flat tools, just list top-level directories
-        return [
-            d.name
-            for d in skills_dir.iterdir()
-            if d.is_dir() and (d / SKILL_MARKER).exists()
-        ]
+        # For flat tools, list top-level directories in a single scandir pass.
+        # DirEntry.is_dir() answers from the directory listing, so only the
+        # SKILL.md probe costs a stat per entry.
+        with os.scandir(skills_dir) as entries:
+            return [
+                entry.name
+                for entry in entries
+                if entry.is_dir()
+                and os.path.exists(os.path.join(entry.path, SKILL_MARKER))
+            ]
 
 
 def is_skill_installed(
@@ -471,4 +695,4 @@ def is_skill_installed(
     """
     skills_dir = tool.get_skills_dir(repo_root)
     skill_path = skills_dir / handle.to_skill_path(tool)
-    return skill_path.exists() and is_valid_skill_dir(skill_path)
+    return is_valid_skill_dir(skill_path)
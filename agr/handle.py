@@ -13,7 +13,9 @@ For tools with nested directory support (e.g., Cursor):
 - Local: local/skillname/
 """
 
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -29,16 +31,44 @@ LOCAL_PREFIX = "local"
 # Legacy separator (colon) for backward compatibility during migration
 LEGACY_SEPARATOR = ":"
 
+# Shape of a remote handle: GitHub username, optional repo, skill name.
+# Checked before anything touches the network so malformed input fails fast.
+# Dot-only segments ("." and "..") are refused: they would turn install
+# paths like user/.. into the skills directory itself.
+_REMOTE_HANDLE_RE = re.compile(
+    r"[A-Za-z0-9][A-Za-z0-9-]{0,38}(?:/(?!\.+(?:/|$))[A-Za-z0-9._-]{1,100}){1,2}"
+)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class ParsedHandle:
-    """Parsed resource handle."""
+    """Parsed resource handle.
+
+    Frozen so parsed remote handles can be cached and shared between callers.
+    """
 
     username: str | None = None  # GitHub username, None for local
     repo: str | None = None  # Repository name, None = default (agent-resources)
     name: str = ""  # Skill name (final segment)
     is_local: bool = False  # True for local path references
     local_path: Path | None = None  # Original local path if is_local
+    # Derived from the fields above; computed once since every tool's
+    # install path and SKILL.md name is built from it
+    _installed_name: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the installed directory name."""
+        sep = INSTALLED_NAME_SEPARATOR
+        if self.is_local:
+            installed_name = f"{LOCAL_PREFIX}{sep}{self.name}"
+        elif not self.username:
+            installed_name = self.name
+        elif self.repo:
+            installed_name = f"{self.username}{sep}{self.repo}{sep}{self.name}"
+        else:
+            installed_name = f"{self.username}{sep}{self.name}"
+        # Frozen dataclass: bypass the generated __setattr__
+        object.__setattr__(self, "_installed_name", installed_name)
 
     @property
     def is_remote(self) -> bool:
@@ -71,16 +101,7 @@ class ParsedHandle:
             Remote: "kasperjunge--commit" or "maragudk--skills--collaboration"
             Local: "local--my-skill"
         """
-        sep = INSTALLED_NAME_SEPARATOR
-        if self.is_local:
-            return f"{LOCAL_PREFIX}{sep}{self.name}"
-
-        if not self.username:
-            return self.name
-
-        if self.repo:
-            return f"{self.username}{sep}{self.repo}{sep}{self.name}"
-        return f"{self.username}{sep}{self.name}"
+        return self._installed_name
 
     def get_github_repo(self) -> tuple[str, str]:
         """Get (username, repo_name) for GitHub download.
@@ -110,10 +131,9 @@ class ParsedHandle:
         """
         if tool.supports_nested:
             if self.is_local:
-                return Path("local") / self.name
-            if self.repo:
-                return Path(self.username or "") / self.repo / self.name
-            return Path(self.username or "") / self.name
+                return Path(LOCAL_PREFIX, self.name)
+            # Path() skips empty segments, covering a missing username or repo
+            return Path(self.username or "", self.repo or "", self.name)
         else:
             return Path(self.to_installed_name())
 
@@ -177,8 +197,27 @@ def parse_handle(ref: str) -> ParsedHandle:
                 local_path=test_path,
             )
 
-    # Remote handle: split by /
-    parts = ref.split("/")
+    return _parse_remote_handle(ref)
+
+
+@lru_cache(maxsize=512)
+def _parse_remote_handle(ref: str) -> ParsedHandle:
+    """Parse a remote user/name or user/repo/name handle.
+
+    Unlike local detection this depends only on the string, so results are
+    cached; sync and list parse the same handles several times per run.
+
+    Args:
+        ref: Stripped handle string that is not a local path
+
+    Returns:
+        ParsedHandle for the remote skill.
+
+    Raises:
+        InvalidHandleError: If the handle format is invalid.
+    """
+    # At most user/repo/name; a fourth part means too many segments
+    parts = ref.split("/", 3)
 
     if len(parts) == 1:
         # Simple name like "commit" - treat as local since no username
@@ -186,32 +225,28 @@ def parse_handle(ref: str) -> ParsedHandle:
             f"Invalid handle '{ref}': remote handles require username/name format"
         )
 
-    if len(parts) == 2:
-        # user/name format
-        username, skill_name = parts[0], parts[1]
-        _validate_no_separator_in_components(
-            ref, username=username, skill_name=skill_name
-        )
-        return ParsedHandle(
-            username=username,
-            name=skill_name,
+    if len(parts) == 4:
+        raise InvalidHandleError(
+            f"Invalid handle '{ref}': too many path segments (expected user/name or user/repo/name)"
         )
 
-    if len(parts) == 3:
-        # user/repo/name format
-        username, repo, skill_name = parts[0], parts[1], parts[2]
-        _validate_no_separator_in_components(
-            ref, username=username, repo=repo, skill_name=skill_name
-        )
-        return ParsedHandle(
-            username=username,
-            repo=repo,
-            name=skill_name,
+    if not _REMOTE_HANDLE_RE.fullmatch(ref):
+        raise InvalidHandleError(
+            f"Invalid handle '{ref}': expected user/name or user/repo/name "
+            "using GitHub name characters"
         )
 
-    raise InvalidHandleError(
-        f"Invalid handle '{ref}': too many path segments (expected user/name or user/repo/name)"
+    if len(parts) == 2:
+        # user/name format
+        username, skill_name = parts
+        repo = None
+    else:
+        # user/repo/name format
+        username, repo, skill_name = parts
+    _validate_no_separator_in_components(
+        ref, username=username, repo=repo, skill_name=skill_name
     )
+    return ParsedHandle(username=username, repo=repo, name=skill_name)
 
 
 def _validate_no_separator_in_name(ref: str, name: str) -> None:
@@ -274,19 +309,16 @@ def installed_name_to_toml_handle(installed_name: str) -> str:
     """
     # Support legacy colon format during migration
     if LEGACY_SEPARATOR in installed_name:
-        parts = installed_name.split(LEGACY_SEPARATOR)
-        if parts[0] == LOCAL_PREFIX:
-            return parts[1] if len(parts) > 1 else installed_name
-        return "/".join(parts)
-
-    # New separator format
-    if INSTALLED_NAME_SEPARATOR not in installed_name:
+        sep = LEGACY_SEPARATOR
+    elif INSTALLED_NAME_SEPARATOR in installed_name:
+        sep = INSTALLED_NAME_SEPARATOR
+    else:
         return installed_name
 
-    parts = installed_name.split(INSTALLED_NAME_SEPARATOR)
-    if parts[0] == LOCAL_PREFIX:
+    prefix, _, rest = installed_name.partition(sep)
+    if prefix == LOCAL_PREFIX:
         # Local skill - return just the name (path is lost)
-        return parts[1] if len(parts) > 1 else installed_name
+        return rest.split(sep, 1)[0]
 
     # Remote: convert separators to slashes
-    return "/".join(parts)
+    return installed_name.replace(sep, "/")
@@ -1,8 +1,11 @@
 """Skill validation and SKILL.md handling."""
 
+import os
 import re
+import stat
 from enum import Enum
 from pathlib import Path
+from typing import Iterator
 
 
 class ResourceType(Enum):
@@ -16,38 +19,43 @@ class ResourceType(Enum):
 SKILL_MARKER = "SKILL.md"
 
 # Directories to exclude from skill discovery
-EXCLUDED_DIRS = {
-    ".git",
-    "node_modules",
-    "__pycache__",
-    ".venv",
-    "venv",
-    ".tox",
-    "vendor",
-    "build",
-    "dist",
-    ".mypy_cache",
-    ".pytest_cache",
-    ".ruff_cache",
-}
-
-
-def _is_excluded_path(path: Path, repo_dir: Path) -> bool:
-    """Check if a path should be excluded from skill discovery.
+EXCLUDED_DIRS = frozenset(
+    {
+        ".git",
+        "node_modules",
+        "__pycache__",
+        ".venv",
+        "venv",
+        ".tox",
+        "vendor",
+        "build",
+        "dist",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+    }
+)
+
+
+def _iter_skill_dirs(repo_dir: Path) -> Iterator[Path]:
+    """Yield every directory under repo_dir that contains SKILL.md.
+
+    Excluded directories (.git, node_modules, etc.) are pruned from the walk
+    so they are never descended into. A SKILL.md at the repo root itself is
+    skipped.
 
     Args:
-        path: Path to check
-        repo_dir: Root of the repository (to detect root-level SKILL.md)
+        repo_dir: Root of the repository to search
 
-    Returns:
-        True if the path should be excluded
+    Yields:
+        Skill directories, in top-down walk order
     """
-    # Exclude root-level SKILL.md (parent is the repo itself)
-    if path.parent == repo_dir:
-        return True
-
-    # Exclude paths containing excluded directories
-    return any(part in EXCLUDED_DIRS for part in path.parts)
+    for dirpath, dirnames, filenames in os.walk(repo_dir):
+        # Prune in place so os.walk skips excluded subtrees entirely;
+        # sorting keeps the walk order deterministic across filesystems.
+        dirnames[:] = sorted(d for d in dirnames if d not in EXCLUDED_DIRS)
+        if SKILL_MARKER in filenames and dirpath != str(repo_dir):
+            yield Path(dirpath)
 
 
 def is_valid_skill_dir(path: Path) -> bool:
@@ -59,9 +67,13 @@ def is_valid_skill_dir(path: Path) -> bool:
     Returns:
         True if the path is a directory containing SKILL.md
     """
-    if not path.is_dir():
+    # A single stat on the marker also answers whether path is a directory:
+    # the lookup fails with ENOENT/ENOTDIR otherwise.
+    try:
+        st = os.stat(os.path.join(path, SKILL_MARKER))
+    except OSError:
         return False
-    return (path / SKILL_MARKER).exists()
+    return stat.S_ISREG(st.st_mode)
 
 
 def find_skill_in_repo(repo_dir: Path, skill_name: str) -> Path | None:
@@ -81,13 +93,21 @@ def find_skill_in_repo(repo_dir: Path, skill_name: str) -> Path | None:
     Returns:
         Path to skill directory if found, None otherwise
     """
-    matches: list[Path] = []
-
-    for skill_md in repo_dir.rglob(SKILL_MARKER):
-        if _is_excluded_path(skill_md, repo_dir):
-            continue
-        if skill_md.parent.name == skill_name:
-            matches.append(skill_md.parent)
+    # A top-level match is always the shallowest, so one stat can skip the walk
+    top_level = repo_dir / skill_name
+    if (
+        top_level.parent == repo_dir
+        and skill_name not in EXCLUDED_DIRS
+        and skill_name != ".."
+        and is_valid_skill_dir(top_level)
+    ):
+        return top_level
+
+    matches = [
+        skill_dir
+        for skill_dir in _iter_skill_dirs(repo_dir)
+        if skill_dir.name == skill_name
+    ]
 
     if not matches:
         return None
@@ -114,11 +134,7 @@ def discover_skills_in_repo(repo_dir: Path) -> list[tuple[str, Path]]:
     # Collect all skills, keyed by name (shallowest path wins)
     skills_by_name: dict[str, Path] = {}
 
-    for skill_md in repo_dir.rglob(SKILL_MARKER):
-        if _is_excluded_path(skill_md, repo_dir):
-            continue
-
-        skill_dir = skill_md.parent
+    for skill_dir in _iter_skill_dirs(repo_dir):
         skill_name = skill_dir.name
 
         # Keep shallowest path for duplicate names
@@ -10,7 +10,7 @@ from pathlib import Path
 from agr.exceptions import AgrError
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolConfig:
     """Configuration for an AI coding tool."""
 
@@ -30,12 +30,12 @@ class ToolConfig:
 
     def get_skills_dir(self, repo_root: Path) -> Path:
         """Get the skills directory for this tool in a repo."""
-        return repo_root / self.config_dir / self.skills_subdir
+        return repo_root.joinpath(self.config_dir, self.skills_subdir)
 
     def get_global_skills_dir(self) -> Path:
         """Get the global skills directory (in user home)."""
         base = self.global_config_dir or self.config_dir
-        return Path.home() / base / self.skills_subdir
+        return Path.home().joinpath(base, self.skills_subdir)
 
 
 # Claude Code tool configuration (flat naming: maragudk--skills--bluesky)
@@ -82,11 +82,7 @@ COPILOT = ToolConfig(
 )
 
 # Registry of all supported tools
-TOOLS: dict[str, ToolConfig] = {
-    "claude": CLAUDE,
-    "cursor": CURSOR,
-    "copilot": COPILOT,
-}
+TOOLS: dict[str, ToolConfig] = {tool.name: tool for tool in (CLAUDE, CURSOR, COPILOT)}
 
 # Default tool names for new configurations
 DEFAULT_TOOL_NAMES: list[str] = ["claude"]
@@ -107,7 +103,8 @@ def get_tool(name: str) -> ToolConfig:
     Raises:
         AgrError: If tool name is not recognized
     """
-    if name not in TOOLS:
+    tool = TOOLS.get(name)
+    if tool is None:
         available = ", ".join(TOOLS.keys())
         raise AgrError(f"Unknown tool '{name}'. Available tools: {available}")
-    return TOOLS[name]
+    return tool
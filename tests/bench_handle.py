@@ -0,0 +1,40 @@
+"""Microbenchmarks for agr.handle conversions.
+
+Not collected by default (the file doesn't match test_*.py). Run with:
+
+    pytest tests/bench_handle.py
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from agr.handle import (  # noqa: E402
+    ParsedHandle,
+    _parse_remote_handle,
+    installed_name_to_toml_handle,
+)
+
+HANDLE = "kasperjunge/product-strategy/growth-hacker"
+INSTALLED_NAME = "kasperjunge--product-strategy--growth-hacker"
+
+
+@pytest.mark.benchmark(group="handle")
+class TestHandleBenchmarks:
+    """Per-call cost of the handle conversions used by sync and list."""
+
+    def test_parse_remote_handle(self, benchmark):
+        """Uncached remote parse (bypasses the lru_cache)."""
+        result = benchmark(_parse_remote_handle.__wrapped__, HANDLE)
+        assert result.name == "growth-hacker"
+
+    def test_to_installed_name(self, benchmark):
+        """ParsedHandle -> installed directory name."""
+        handle = ParsedHandle(
+            username="kasperjunge", repo="product-strategy", name="growth-hacker"
+        )
+        assert benchmark(handle.to_installed_name) == INSTALLED_NAME
+
+    def test_installed_name_to_toml_handle(self, benchmark):
+        """Installed directory name -> agr.toml handle."""
+        assert benchmark(installed_name_to_toml_handle, INSTALLED_NAME) == HANDLE
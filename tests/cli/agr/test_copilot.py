@@ -96,7 +96,7 @@ class TestCopilotRemove:
     ):
         """agr remove removes skill from .github/skills/."""
         cli_config('tools = ["copilot"]\ndependencies = []')
-        agr("add", "./skills/test-skill")
+        agr("add", "./skills/test-skill", capture=False)
 
         installed = cli_project / ".github" / "skills" / "local--test-skill"
         assert installed.exists()
@@ -154,7 +154,7 @@ dependencies = [
     ):
         """agr remove removes skill from all configured tools."""
         cli_config('tools = ["claude", "copilot"]\ndependencies = []')
-        agr("add", "./skills/test-skill")
+        agr("add", "./skills/test-skill", capture=False)
 
         result = agr("remove", "./skills/test-skill")
 
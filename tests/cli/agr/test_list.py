@@ -22,7 +22,7 @@ class TestAgrList:
 
     def test_list_shows_installed_skills(self, agr, cli_skill):
         """agr list shows installed skills."""
-        agr("add", "./skills/test-skill")
+        agr("add", "./skills/test-skill", capture=False)
 
         result = agr("list")
 
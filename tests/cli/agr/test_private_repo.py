@@ -50,8 +50,12 @@ dependencies = [
         assert secret_token not in result.stderr
 
 
+@pytest.mark.network
 class TestAuthErrorMessages:
-    """Tests for helpful authentication error messages."""
+    """Tests for helpful authentication error messages.
+
+    These need a real GitHub 404 response, so they require network access.
+    """
 
     def test_nonexistent_repo_without_token_mentions_token(
         self, agr, cli_config, monkeypatch
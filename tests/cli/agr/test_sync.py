@@ -22,7 +22,7 @@ class TestAgrSync:
 
     def test_sync_reports_up_to_date(self, agr, cli_project, cli_skill):
         """agr sync reports already installed skills."""
-        agr("add", "./skills/test-skill")
+        agr("add", "./skills/test-skill", capture=False)
 
         result = agr("sync")
 
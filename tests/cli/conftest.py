@@ -1,7 +1,7 @@
 """Fixtures for CLI tests."""
 
 import shutil
-import subprocess
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
@@ -20,11 +20,17 @@ def pytest_configure(config):
     )
 
 
+@lru_cache(maxsize=None)
+def _cli_available(cli_name: str) -> bool:
+    """Check PATH for a CLI tool once per session."""
+    return shutil.which(cli_name) is not None
+
+
 def pytest_runtest_setup(item):
     """Skip tests that require unavailable CLI tools."""
     for marker in item.iter_markers(name="requires_cli"):
         cli_name = marker.args[0]
-        if shutil.which(cli_name) is None:
+        if not _cli_available(cli_name):
             pytest.skip(f"Test requires '{cli_name}' CLI which is not installed")
 
 
@@ -34,20 +40,9 @@ def cli_project(tmp_path: Path) -> Path:
     project = tmp_path / "project"
     project.mkdir()
 
-    # Initialize as git repo
-    subprocess.run(["git", "init"], cwd=project, capture_output=True, check=True)
-    subprocess.run(
-        ["git", "config", "user.email", "test@test.com"],
-        cwd=project,
-        capture_output=True,
-        check=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Test"],
-        cwd=project,
-        capture_output=True,
-        check=True,
-    )
+    # agr only checks for a .git directory to find the repo root, so a real
+    # git init (and the subprocesses it costs) is unnecessary
+    (project / ".git").mkdir()
 
     return project
 
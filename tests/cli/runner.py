@@ -41,20 +41,28 @@ def run_cli(
     env: dict[str, str] | None = None,
     input: str | None = None,
     timeout: int = DEFAULT_TIMEOUT,
+    capture: bool = True,
 ) -> CLIResult:
-    """Run a CLI command and return the result."""
+    """Run a CLI command and return the result.
+
+    Pass capture=False for setup steps that only need the exit code; output
+    is discarded instead of piped and decoded, and the result's stdout and
+    stderr are empty.
+    """
     # Merge env with NO_COLOR=1 to disable Rich colors
     full_env = os.environ.copy()
     full_env["NO_COLOR"] = "1"
     if env:
         full_env.update(env)
 
+    output = subprocess.PIPE if capture else subprocess.DEVNULL
     result = subprocess.run(
         args,
         cwd=cwd,
         env=full_env,
         input=input,
-        capture_output=True,
+        stdout=output,
+        stderr=output,
         text=True,
         timeout=timeout,
     )
@@ -62,6 +70,6 @@ def run_cli(
     return CLIResult(
         args=args,
         returncode=result.returncode,
-        stdout_raw=result.stdout,
-        stderr_raw=result.stderr,
+        stdout_raw=result.stdout or "",
+        stderr_raw=result.stderr or "",
     )
@@ -12,6 +12,17 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "network: tests that make real network requests")
 
 
+def pytest_collection_modifyitems(config, items):
+    """Keep GitHub-bound tests on one xdist worker under --dist loadgroup.
+
+    Spreading them across workers would only multiply concurrent requests
+    against GitHub's rate limit; filesystem-only tests distribute freely.
+    """
+    for item in items:
+        if item.get_closest_marker("network") or item.get_closest_marker("e2e"):
+            item.add_marker(pytest.mark.xdist_group("github"))
+
+
 @pytest.fixture(autouse=True)
 def skip_e2e_in_ci(request):
     """Auto-skip E2E tests in CI based on SKIP_E2E env var."""
@@ -29,9 +40,21 @@ def git_project(tmp_path: Path, monkeypatch):
 
 
 @pytest.fixture
-def skill_fixture(tmp_path: Path) -> Path:
-    """Create a valid skill directory."""
-    skill_dir = tmp_path / "test-skill"
+def repo_root(tmp_path: Path) -> Path:
+    """Create a temporary repository root (without changing directory)."""
+    root = tmp_path / "repo"
+    root.mkdir()
+    (root / ".git").mkdir()
+    return root
+
+
+@pytest.fixture(scope="session")
+def skill_fixture(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a valid skill directory.
+
+    Built once per session; tests only read from it or copy it elsewhere.
+    """
+    skill_dir = tmp_path_factory.mktemp("skill_fixture") / "test-skill"
     skill_dir.mkdir()
     (skill_dir / "SKILL.md").write_text("""---
 name: test-skill
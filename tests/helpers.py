@@ -0,0 +1,20 @@
+"""Filesystem helpers shared across tests."""
+
+from pathlib import Path
+
+
+def make_tree(root: Path, spec: dict[str, bytes]) -> None:
+    """Create files under root from a mapping of relative path to content.
+
+    Parent directories are created once each, shallowest first, before any
+    file is written.
+
+    Args:
+        root: Directory to create the tree in
+        spec: Mapping of relative file path to raw file content
+    """
+    dirs = {(root / rel).parent for rel in spec}
+    for directory in sorted(dirs, key=lambda p: len(p.parts)):
+        directory.mkdir(parents=True, exist_ok=True)
+    for rel, content in spec.items():
+        (root / rel).write_bytes(content)
@@ -1,12 +1,22 @@
 """Tests for agr.commands module (integration tests)."""
 
+import shutil
 import sys
+import threading
+from contextlib import contextmanager
 
 import pytest
 
+from agr.commands import sync
+from agr.commands import tools as tools_module
+from agr.commands.add import run_add
 from agr.commands.init import init_config, init_skill
 from agr.commands.list import run_list
+from agr.commands.remove import run_remove
+from agr.commands.sync import run_sync
+from agr.commands.tools import run_tools_add, run_tools_list, run_tools_remove
 from agr.config import AgrConfig, Dependency
+from agr.exceptions import AgrError, InstallPermissionError, SkillNotFoundError
 from agr.skill import SKILL_MARKER
 
 # Windows doesn't allow colons in directory names
@@ -15,54 +25,53 @@ skip_on_windows = pytest.mark.skipif(
 )
 
 
+@pytest.fixture
+def project_skill(git_project, skill_fixture):
+    """Copy the fixture skill into the project as ./skills/test-skill."""
+    shutil.copytree(skill_fixture, git_project / "skills" / "test-skill")
+    return "./skills/test-skill"
+
+
 class TestInitCommand:
     """Tests for init command."""
 
-    def test_init_config_creates_file(self, tmp_path, monkeypatch):
+    def test_init_config_creates_file(self, tmp_path):
         """init_config creates agr.toml."""
-        monkeypatch.chdir(tmp_path)
-
-        config_path, created = init_config()
+        config_path, created = init_config(tmp_path)
 
         assert created
         assert config_path.exists()
         assert config_path.name == "agr.toml"
 
-    def test_init_config_existing(self, tmp_path, monkeypatch):
+    def test_init_config_existing(self, tmp_path):
         """init_config with existing file returns it."""
-        monkeypatch.chdir(tmp_path)
         (tmp_path / ".git").mkdir()
         existing = tmp_path / "agr.toml"
         existing.write_text("dependencies = []")
 
-        config_path, created = init_config()
+        config_path, created = init_config(tmp_path)
 
         assert not created
         assert config_path == existing
 
-    def test_init_skill_creates_scaffold(self, tmp_path, monkeypatch):
+    def test_init_skill_creates_scaffold(self, tmp_path):
         """init_skill creates skill scaffold."""
-        monkeypatch.chdir(tmp_path)
-
-        skill_path = init_skill("my-skill")
+        skill_path = init_skill("my-skill", tmp_path)
 
         assert skill_path.exists()
         assert (skill_path / SKILL_MARKER).exists()
 
-    def test_init_skill_invalid_name(self, tmp_path, monkeypatch):
+    def test_init_skill_invalid_name(self, tmp_path):
         """init_skill with invalid name raises."""
-        monkeypatch.chdir(tmp_path)
-
         with pytest.raises(ValueError):
-            init_skill("-invalid")
+            init_skill("-invalid", tmp_path)
 
-    def test_init_skill_existing_dir(self, tmp_path, monkeypatch):
+    def test_init_skill_existing_dir(self, tmp_path):
         """init_skill with existing directory raises."""
-        monkeypatch.chdir(tmp_path)
         (tmp_path / "existing").mkdir()
 
         with pytest.raises(FileExistsError):
-            init_skill("existing")
+            init_skill("existing", tmp_path)
 
 
 class TestListCommand:
@@ -105,11 +114,7 @@ class TestAddRemoveCommands:
 
     def test_add_local_skill(self, git_project, skill_fixture):
         """Add a local skill."""
-        from agr.commands.add import run_add
-
         # Move skill fixture into the project
-        import shutil
-
         local_skill = git_project / "my-skill"
         shutil.copytree(skill_fixture, local_skill)
 
@@ -126,12 +131,7 @@ class TestAddRemoveCommands:
 
     def test_remove_local_skill(self, git_project, skill_fixture):
         """Remove a local skill."""
-        from agr.commands.add import run_add
-        from agr.commands.remove import run_remove
-
         # First add the skill
-        import shutil
-
         local_skill = git_project / "my-skill"
         shutil.copytree(skill_fixture, local_skill)
         run_add(["./my-skill"])
@@ -147,11 +147,78 @@ class TestAddRemoveCommands:
         installed_dir = git_project / ".claude" / "skills" / "local--my-skill"
         assert not installed_dir.exists()
 
+    def test_add_warns_before_saving_without_duplicates(
+        self, git_project, skill_fixture, capsys
+    ):
+        """Duplicates dropped from agr.toml on save are reported first."""
+        shutil.copytree(skill_fixture, git_project / "my-skill")
+        (git_project / "agr.toml").write_text("""
+dependencies = [
+    { handle = "kasperjunge/commit", type = "skill" },
+    { handle = "kasperjunge/commit", type = "skill" },
+]
+""")
+
+        run_add(["./my-skill"])
+
+        out = capsys.readouterr().out
+        assert "Duplicate dependency in agr.toml" in out
+        assert "kasperjunge/commit" in out
+        config = AgrConfig.load(git_project / "agr.toml")
+        assert config.duplicates == []
+
+    def test_add_local_skill_writes_skill_md(self, git_project, skill_fixture):
+        """Added local skill is installed with its SKILL.md."""
+        shutil.copytree(skill_fixture, git_project / "my-skill")
+
+        run_add(["./my-skill"])
+
+        installed_dir = git_project / ".claude" / "skills" / "local--my-skill"
+        assert (installed_dir / SKILL_MARKER).exists()
+
+    def test_add_nonexistent_path_fails(self, git_project, capsys):
+        """Adding a path that does not exist fails without writing config."""
+        with pytest.raises(SystemExit) as exc_info:
+            run_add(["./nonexistent"])
+
+        assert exc_info.value.code == 1
+        out = capsys.readouterr().out
+        assert "Failed:" in out
+        assert "Path does not exist" in out
+        assert not (git_project / "agr.toml").exists()
+
+    def test_add_invalid_handle_fails(self, git_project, capsys):
+        """Adding an invalid handle fails."""
+        with pytest.raises(SystemExit) as exc_info:
+            run_add(["not-a-valid-handle"])
+
+        assert exc_info.value.code == 1
+        assert "Failed:" in capsys.readouterr().out
+
+    def test_add_already_installed_suggests_overwrite(
+        self, git_project, skill_fixture, capsys
+    ):
+        """Adding an installed skill again fails and suggests --overwrite."""
+        shutil.copytree(skill_fixture, git_project / "my-skill")
+        run_add(["./my-skill"])
+        capsys.readouterr()
+
+        with pytest.raises(SystemExit):
+            run_add(["./my-skill"])
+
+        assert "--overwrite" in capsys.readouterr().out
+
+    def test_remove_without_config_fails(self, git_project, capsys):
+        """Removing when no agr.toml exists fails."""
+        with pytest.raises(SystemExit) as exc_info:
+            run_remove(["./my-skill"])
+
+        assert exc_info.value.code == 1
+        assert "No agr.toml found" in capsys.readouterr().out
+
     @pytest.mark.e2e
     def test_add_remote_skill(self, git_project):
         """Add a remote skill from GitHub."""
-        from agr.commands.add import run_add
-
         run_add(["kasperjunge/migrate-to-skills"])
 
         # Check config
@@ -171,8 +238,6 @@ class TestSyncCommand:
 
     def test_sync_empty(self, git_project, capsys):
         """sync with no config prints message."""
-        from agr.commands.sync import run_sync
-
         run_sync()
 
         captured = capsys.readouterr()
@@ -180,12 +245,7 @@ class TestSyncCommand:
 
     def test_sync_up_to_date(self, git_project, skill_fixture, capsys):
         """sync when already installed shows up to date."""
-        from agr.commands.add import run_add
-        from agr.commands.sync import run_sync
-
         # Add skill
-        import shutil
-
         local_skill = git_project / "my-skill"
         shutil.copytree(skill_fixture, local_skill)
         run_add(["./my-skill"])
@@ -199,8 +259,6 @@ class TestSyncCommand:
     @skip_on_windows
     def test_sync_migrates_colon_directories(self, git_project, capsys):
         """Sync should rename colon-based directories to double-hyphen."""
-        from agr.commands.sync import run_sync
-
         # Setup: create old-format skill directory
         skills_dir = git_project / ".claude" / "skills"
         old_skill = skills_dir / "user:skill"
@@ -226,8 +284,6 @@ class TestSyncCommand:
     @skip_on_windows
     def test_sync_migrates_multiple_colon_directories(self, git_project, capsys):
         """Sync should migrate all colon-based directories."""
-        from agr.commands.sync import run_sync
-
         # Setup: create multiple old-format skill directories
         skills_dir = git_project / ".claude" / "skills"
         skills_dir.mkdir(parents=True)
@@ -254,8 +310,6 @@ class TestSyncCommand:
     @skip_on_windows
     def test_sync_skips_migration_if_target_exists(self, git_project, capsys):
         """Sync should skip migration when target directory already exists."""
-        from agr.commands.sync import run_sync
-
         # Setup: create both old and new format directories
         skills_dir = git_project / ".claude" / "skills"
         old_skill = skills_dir / "user:skill"
@@ -282,13 +336,11 @@ class TestSyncCommand:
     @skip_on_windows
     def test_sync_ignores_non_skill_colon_directories(self, git_project, capsys):
         """Sync should not migrate directories without SKILL.md."""
-        from agr.commands.sync import run_sync
-
         # Setup: create a colon-based directory without SKILL.md
         skills_dir = git_project / ".claude" / "skills"
         non_skill = skills_dir / "not:a:skill"
         non_skill.mkdir(parents=True)
-        (non_skill / "README.md").write_text("# Not a skill")
+        (non_skill / "README.md").touch()
 
         # Create minimal config
         (git_project / "agr.toml").write_text("dependencies = []")
@@ -299,3 +351,425 @@ class TestSyncCommand:
         # Directory should not be migrated
         assert non_skill.exists(), "Non-skill directory should not be migrated"
         assert not (skills_dir / "not--a--skill").exists()
+
+    def test_sync_warns_about_duplicate_dependencies(
+        self, git_project, project_skill, capsys
+    ):
+        """Duplicate agr.toml entries are named instead of dropped silently."""
+        (git_project / "agr.toml").write_text("""
+dependencies = [
+    { path = "./skills/test-skill", type = "skill" },
+    { path = "skills/test-skill", type = "skill" },
+]
+""")
+
+        run_sync()
+
+        out = capsys.readouterr().out
+        assert "Duplicate dependency in agr.toml" in out
+        assert "skills/test-skill" in out.split("Duplicate", 1)[1]
+        assert "1 installed" in out
+
+    def test_sync_downloads_remote_deps_concurrently(
+        self, git_project, monkeypatch, capsys
+    ):
+        """Distinct repositories are fetched in parallel and reported in order."""
+        # Both downloads must be in flight at once for the barrier to release
+        barrier = threading.Barrier(2, timeout=5)
+
+        @contextmanager
+        def fake_download(username, repo_name):
+            barrier.wait()
+            yield git_project
+
+        def fake_fetch(handle, repo_root, tools, overwrite, repo_dir):
+            if handle.name == "missing":
+                raise SkillNotFoundError("Skill 'missing' not found")
+            return {}
+
+        monkeypatch.setattr(sync, "downloaded_repo", fake_download)
+        monkeypatch.setattr(sync, "fetch_and_install_to_tools", fake_fetch)
+        (git_project / "agr.toml").write_text("""
+dependencies = [
+    { handle = "user/one/missing", type = "skill" },
+    { handle = "user/two/present", type = "skill" },
+]
+""")
+
+        with pytest.raises(SystemExit):
+            run_sync()
+
+        out = capsys.readouterr().out
+        assert out.index("user/one/missing") < out.index("user/two/present")
+        assert "Installed: user/two/present" in out
+        assert "1 installed, 1 failed" in out
+
+    def test_sync_local_deps_same_name_do_not_race(
+        self, git_project, skill_fixture, capsys
+    ):
+        """Local skills sharing an installed name are synced one after another."""
+        for parent in ("a", "b"):
+            shutil.copytree(skill_fixture, git_project / parent / "test-skill")
+        shutil.copytree(skill_fixture, git_project / "c" / "other-skill")
+        (git_project / "agr.toml").write_text("""
+dependencies = [
+    { path = "./a/test-skill", type = "skill" },
+    { path = "./c/other-skill", type = "skill" },
+    { path = "./b/test-skill", type = "skill" },
+]
+""")
+
+        run_sync()
+
+        out = capsys.readouterr().out
+        assert "Installed: ./a/test-skill" in out
+        assert "Installed: ./c/other-skill" in out
+        # Same installed path as ./a/test-skill, so it sees that install
+        assert "Up to date: ./b/test-skill" in out
+
+    def test_sync_downloads_shared_repo_once(self, git_project, monkeypatch, capsys):
+        """Skills from the same repository share a single download."""
+        downloads = []
+        installed_from = []
+
+        @contextmanager
+        def fake_download(username, repo_name):
+            downloads.append((username, repo_name))
+            yield git_project
+
+        def fake_fetch(handle, repo_root, tools, overwrite, repo_dir):
+            installed_from.append((handle.name, repo_dir))
+            return {}
+
+        monkeypatch.setattr(sync, "downloaded_repo", fake_download)
+        monkeypatch.setattr(sync, "fetch_and_install_to_tools", fake_fetch)
+        (git_project / "agr.toml").write_text("""
+dependencies = [
+    { handle = "user/repo/alpha", type = "skill" },
+    { handle = "user/repo/beta", type = "skill" },
+]
+""")
+
+        run_sync()
+
+        assert downloads == [("user", "repo")]
+        assert installed_from == [("alpha", git_project), ("beta", git_project)]
+        assert "2 installed" in capsys.readouterr().out
+
+    def test_sync_equivalent_handles_do_not_share_files(
+        self, git_project, tmp_path, monkeypatch
+    ):
+        """Two handles for one skill in a shared download get separate files."""
+        skill_src = tmp_path / "agent-resources-main" / "skills" / "commit"
+        skill_src.mkdir(parents=True)
+        (skill_src / SKILL_MARKER).write_text("# Commit")
+        (skill_src / "run.sh").write_text("echo hi")
+
+        @contextmanager
+        def fake_download(username, repo_name):
+            yield tmp_path / "agent-resources-main"
+
+        monkeypatch.setattr(sync, "downloaded_repo", fake_download)
+        (git_project / "agr.toml").write_text("""
+dependencies = [
+    { handle = "kasperjunge/commit", type = "skill" },
+    { handle = "kasperjunge/agent-resources/commit", type = "skill" },
+]
+""")
+
+        run_sync()
+
+        skills_dir = git_project / ".claude" / "skills"
+        short = skills_dir / "kasperjunge--commit" / "run.sh"
+        full = skills_dir / "kasperjunge--agent-resources--commit" / "run.sh"
+        assert short.read_text() == full.read_text() == "echo hi"
+        assert not short.samefile(full)
+
+    def test_sync_failed_download_keeps_installed_deps_up_to_date(
+        self, git_project, monkeypatch, capsys
+    ):
+        """A failed shared download only fails the deps that needed it."""
+        downloads = []
+
+        @contextmanager
+        def failing_download(username, repo_name):
+            downloads.append((username, repo_name))
+            raise AgrError("Network error: ConnectError")
+            yield  # pragma: no cover
+
+        monkeypatch.setattr(sync, "downloaded_repo", failing_download)
+        installed = git_project / ".claude" / "skills" / "user--repo--alpha"
+        installed.mkdir(parents=True)
+        (installed / SKILL_MARKER).write_text("# Alpha")
+        (git_project / "agr.toml").write_text("""
+dependencies = [
+    { handle = "user/repo/alpha", type = "skill" },
+    { handle = "user/repo/beta", type = "skill" },
+]
+""")
+
+        with pytest.raises(SystemExit):
+            run_sync()
+
+        out = capsys.readouterr().out
+        assert downloads == [("user", "repo")]
+        assert "Up to date: user/repo/alpha" in out
+        assert "1 up to date, 1 failed" in out
+
+    def test_sync_unwritable_target_skips_download(
+        self, git_project, monkeypatch, capsys
+    ):
+        """An unwritable skills directory fails the group without downloading."""
+        downloads = []
+
+        @contextmanager
+        def fake_download(username, repo_name):
+            downloads.append((username, repo_name))
+            yield git_project
+
+        def deny_writes(path):
+            raise InstallPermissionError(f"Cannot write to {path}: permission denied")
+
+        monkeypatch.setattr(sync, "downloaded_repo", fake_download)
+        monkeypatch.setattr(sync, "ensure_writable", deny_writes)
+        (git_project / "agr.toml").write_text("""
+dependencies = [
+    { handle = "user/repo/alpha", type = "skill" },
+]
+""")
+
+        with pytest.raises(SystemExit):
+            run_sync()
+
+        out = capsys.readouterr().out
+        assert downloads == []
+        assert "Error: user/repo/alpha" in out
+        assert "Cannot write to" in out
+
+
+class TestMultiToolCommands:
+    """Tests for add/sync/remove with Cursor and multiple configured tools."""
+
+    SYNC_CONFIG = """
+tools = [{tools}]
+dependencies = [
+    {{ path = "./skills/test-skill", type = "skill" }},
+]
+"""
+
+    def test_sync_installs_nested_for_cursor(self, git_project, project_skill):
+        """sync creates .cursor/skills/ and installs to local/<name>/."""
+        (git_project / "agr.toml").write_text(self.SYNC_CONFIG.format(tools='"cursor"'))
+        assert not (git_project / ".cursor").exists()
+
+        run_sync()
+
+        installed = git_project / ".cursor" / "skills" / "local" / "test-skill"
+        assert (installed / SKILL_MARKER).exists()
+
+    def test_remove_cleans_cursor_nested_structure(self, git_project, project_skill):
+        """remove deletes the skill from Cursor's nested structure."""
+        (git_project / "agr.toml").write_text('tools = ["cursor"]\ndependencies = []')
+        run_add([project_skill])
+        installed = git_project / ".cursor" / "skills" / "local" / "test-skill"
+        assert installed.exists()
+
+        run_remove([project_skill])
+
+        assert not installed.exists()
+
+    def test_add_installs_to_claude_and_cursor(self, git_project, project_skill):
+        """add installs flat for Claude and nested for Cursor."""
+        (git_project / "agr.toml").write_text(
+            'tools = ["claude", "cursor"]\ndependencies = []'
+        )
+
+        run_add([project_skill])
+
+        claude_skill = git_project / ".claude" / "skills" / "local--test-skill"
+        cursor_skill = git_project / ".cursor" / "skills" / "local" / "test-skill"
+        assert (claude_skill / SKILL_MARKER).exists()
+        assert (cursor_skill / SKILL_MARKER).exists()
+
+    def test_sync_installs_to_all_tools(self, git_project, project_skill):
+        """sync installs to every configured tool."""
+        (git_project / "agr.toml").write_text(
+            self.SYNC_CONFIG.format(tools='"claude", "cursor"')
+        )
+
+        run_sync()
+
+        assert (git_project / ".claude" / "skills" / "local--test-skill").exists()
+        assert (git_project / ".cursor" / "skills" / "local" / "test-skill").exists()
+
+    def test_remove_removes_from_all_tools(self, git_project, project_skill):
+        """remove deletes the skill from every configured tool."""
+        (git_project / "agr.toml").write_text(
+            'tools = ["claude", "cursor"]\ndependencies = []'
+        )
+        run_add([project_skill])
+
+        run_remove([project_skill])
+
+        assert not (git_project / ".claude" / "skills" / "local--test-skill").exists()
+        assert not (
+            git_project / ".cursor" / "skills" / "local" / "test-skill"
+        ).exists()
+
+
+class TestToolsCommand:
+    """Tests for tools list/add/remove commands."""
+
+    def test_list_configured(self, git_project, capsys):
+        """tools list shows configured tools."""
+        (git_project / "agr.toml").write_text(
+            'tools = ["claude", "cursor"]\ndependencies = []'
+        )
+
+        run_tools_list()
+
+        out = capsys.readouterr().out
+        assert "Configured tools:" in out
+        assert "- claude" in out
+        assert "- cursor" in out
+
+    def test_list_no_config_shows_defaults(self, git_project, capsys):
+        """tools list without agr.toml shows the default tools."""
+        run_tools_list()
+
+        out = capsys.readouterr().out
+        assert "No agr.toml" in out
+        assert "- claude" in out
+
+    def test_list_shows_available(self, git_project, capsys):
+        """tools list shows tools that aren't configured yet."""
+        (git_project / "agr.toml").write_text('tools = ["claude"]\ndependencies = []')
+
+        run_tools_list()
+
+        out = capsys.readouterr().out
+        assert "Available tools:" in out
+        assert "cursor" in out
+
+    def test_add_multiple(self, git_project, capsys):
+        """tools add adds several tools at once."""
+        (git_project / "agr.toml").write_text('tools = ["claude"]\ndependencies = []')
+
+        run_tools_add(["cursor", "copilot"])
+
+        assert AgrConfig.load(git_project / "agr.toml").tools == [
+            "claude",
+            "cursor",
+            "copilot",
+        ]
+
+    def test_add_already_configured(self, git_project, capsys):
+        """tools add skips tools that are already configured."""
+        (git_project / "agr.toml").write_text(
+            'tools = ["claude", "cursor"]\ndependencies = []'
+        )
+
+        run_tools_add(["cursor"])
+
+        assert "Already configured:" in capsys.readouterr().out
+
+    def test_add_no_config_fails(self, git_project, capsys):
+        """tools add fails without agr.toml."""
+        with pytest.raises(SystemExit):
+            run_tools_add(["cursor"])
+
+        assert "No agr.toml" in capsys.readouterr().out
+
+    @pytest.mark.parametrize("run", [run_tools_add, run_tools_remove])
+    def test_unknown_tool_fails(self, git_project, capsys, run):
+        """tools add/remove reject unknown tool names."""
+        (git_project / "agr.toml").write_text("dependencies = []")
+
+        with pytest.raises(SystemExit):
+            run(["invalid-tool"])
+
+        assert "Unknown tool" in capsys.readouterr().out
+
+    def test_add_syncs_existing_dependencies(self, git_project, project_skill, capsys):
+        """tools add installs existing dependencies into the new tool."""
+        run_add([project_skill])
+
+        run_tools_add(["cursor"])
+
+        assert "Installed:" in capsys.readouterr().out
+        cursor_skill = git_project / ".cursor" / "skills" / "local" / "test-skill"
+        assert (cursor_skill / SKILL_MARKER).exists()
+
+    def test_add_reports_only_tools_installed_into(
+        self, git_project, project_skill, skill_fixture, capsys
+    ):
+        """tools add names only the tools a dependency was installed into."""
+        run_add([project_skill])
+        # Already present for Cursor, so only Copilot needs the install
+        shutil.copytree(
+            skill_fixture, git_project / ".cursor" / "skills" / "local" / "test-skill"
+        )
+        capsys.readouterr()
+
+        run_tools_add(["cursor", "copilot"])
+
+        assert "Installed: ./skills/test-skill (copilot)" in capsys.readouterr().out
+
+    def test_remove_last_tool_fails(self, git_project, capsys):
+        """tools remove refuses to remove every configured tool."""
+        (git_project / "agr.toml").write_text('tools = ["claude"]\ndependencies = []')
+
+        with pytest.raises(SystemExit):
+            run_tools_remove(["claude"])
+
+        assert "Cannot remove all tools" in capsys.readouterr().out
+
+    def test_remove_not_configured(self, git_project, capsys):
+        """tools remove reports tools that weren't configured."""
+        (git_project / "agr.toml").write_text('tools = ["claude"]\ndependencies = []')
+
+        run_tools_remove(["cursor"])
+
+        assert "Not configured:" in capsys.readouterr().out
+
+    def test_remove_no_config_fails(self, git_project, capsys):
+        """tools remove fails without agr.toml."""
+        with pytest.raises(SystemExit):
+            run_tools_remove(["claude"])
+
+        assert "No agr.toml" in capsys.readouterr().out
+
+    def test_remove_deletes_skills(self, git_project, project_skill, capsys):
+        """tools remove deletes the removed tool's skills directory."""
+        run_add([project_skill])
+        run_tools_add(["cursor"])
+        cursor_skills = git_project / ".cursor" / "skills"
+        assert cursor_skills.exists()
+
+        run_tools_remove(["cursor"])
+
+        assert "Deleted" in capsys.readouterr().out
+        assert not cursor_skills.exists()
+        assert AgrConfig.load(git_project / "agr.toml").tools == ["claude"]
+
+    def test_remove_keeps_config_on_deletion_failure(
+        self, git_project, project_skill, monkeypatch, capsys
+    ):
+        """tools remove keeps the tool in config if skill deletion fails."""
+        run_add([project_skill])
+        run_tools_add(["cursor"])
+
+        original_rmtree = shutil.rmtree
+
+        def failing_rmtree(path, *args, **kwargs):
+            if ".cursor" in str(path):
+                raise OSError("Permission denied")
+            return original_rmtree(path, *args, **kwargs)
+
+        # Patch in the module where it's used
+        monkeypatch.setattr(tools_module.shutil, "rmtree", failing_rmtree)
+
+        run_tools_remove(["cursor"])
+
+        assert "Error deleting skills" in capsys.readouterr().out
+        assert "cursor" in AgrConfig.load(git_project / "agr.toml").tools
@@ -1,5 +1,8 @@
 """Tests for agr.config module."""
 
+import dataclasses
+from pathlib import Path
+
 import pytest
 
 from agr.config import (
@@ -40,6 +43,13 @@ class TestDependency:
         with pytest.raises(ValueError, match="must have either"):
             Dependency(type="skill")
 
+    def test_dependency_is_frozen_and_hashable(self):
+        """Dependencies are immutable values usable as set members."""
+        dep = Dependency(type="skill", handle="kasperjunge/commit")
+        assert {dep, Dependency(type="skill", handle="kasperjunge/commit")} == {dep}
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            dep.handle = "other/skill"  # type: ignore[misc]
+
 
 class TestAgrConfig:
     """Tests for AgrConfig class."""
@@ -77,6 +87,49 @@ dependencies = [
         with pytest.raises(ConfigError):
             AgrConfig.load(config_path)
 
+    def test_load_drops_duplicate_dependencies(self, tmp_path):
+        """Repeated handles and equivalent paths are loaded once."""
+        config_path = tmp_path / "agr.toml"
+        config_path.write_text("""
+dependencies = [
+    { handle = "kasperjunge/commit", type = "skill" },
+    { path = "./my-skill", type = "skill" },
+    { handle = "kasperjunge/commit", type = "skill" },
+    { path = "my-skill", type = "skill" },
+]
+""")
+        config = AgrConfig.load(config_path)
+        assert [dep.identifier for dep in config.dependencies] == [
+            "kasperjunge/commit",
+            "./my-skill",
+        ]
+        assert [dep.identifier for dep in config.duplicates] == [
+            "kasperjunge/commit",
+            "my-skill",
+        ]
+
+    def test_dropped_path_spelling_still_finds_dependency(self, tmp_path):
+        """Either spelling of a deduplicated local path finds the kept entry."""
+        config_path = tmp_path / "agr.toml"
+        config_path.write_text("""
+dependencies = [
+    { path = "./my-skill", type = "skill" },
+    { path = "my-skill", type = "skill" },
+]
+""")
+        config = AgrConfig.load(config_path)
+
+        assert config.get_by_identifier("my-skill") == config.dependencies[0]
+        assert config.remove_dependency("my-skill")
+        assert config.dependencies == []
+
+    def test_load_directory_raises(self, tmp_path):
+        """An agr.toml that is a directory raises ConfigError."""
+        config_path = tmp_path / "agr.toml"
+        config_path.mkdir()
+        with pytest.raises(ConfigError, match="not a file"):
+            AgrConfig.load(config_path)
+
     def test_save(self, tmp_path):
         """Save config to file."""
         config = AgrConfig()
@@ -132,84 +185,87 @@ dependencies = [
 
 
 class TestFindConfig:
-    """Tests for find_config function."""
+    """Tests for find_config function.
 
-    def test_find_in_current_dir(self, tmp_path, monkeypatch):
+    These only exercise path walking, so they run on pyfakefs's in-memory
+    filesystem and pass start_path rather than changing directory.
+    """
+
+    def test_find_in_current_dir(self, fs):
         """Find config in current directory."""
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / ".git").mkdir()
-        config_path = tmp_path / "agr.toml"
-        config_path.write_text("dependencies = []")
+        fs.create_dir("/repo/.git")
+        fs.create_file("/repo/agr.toml", contents="dependencies = []")
 
-        found = find_config()
-        assert found == config_path
+        found = find_config(Path("/repo"))
+        assert found == Path("/repo/agr.toml")
 
-    def test_find_in_parent_dir(self, tmp_path, monkeypatch):
+    def test_find_in_parent_dir(self, fs):
         """Find config in parent directory."""
-        (tmp_path / ".git").mkdir()
-        config_path = tmp_path / "agr.toml"
-        config_path.write_text("dependencies = []")
-
-        subdir = tmp_path / "subdir"
-        subdir.mkdir()
-        monkeypatch.chdir(subdir)
+        fs.create_dir("/repo/.git")
+        fs.create_file("/repo/agr.toml", contents="dependencies = []")
+        fs.create_dir("/repo/subdir")
 
-        found = find_config()
-        assert found == config_path
+        found = find_config(Path("/repo/subdir"))
+        assert found == Path("/repo/agr.toml")
 
-    def test_not_found_at_git_root(self, tmp_path, monkeypatch):
+    def test_not_found_at_git_root(self, fs):
         """Returns None when not found at git root."""
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / ".git").mkdir()
+        fs.create_dir("/repo/.git")
+        # A config above the git root must not be picked up
+        fs.create_file("/agr.toml", contents="dependencies = []")
 
-        found = find_config()
+        found = find_config(Path("/repo"))
         assert found is None
 
 
-class TestFindRepoRoot:
-    """Tests for find_repo_root function."""
+@pytest.fixture(scope="module")
+def repo_skeleton(tmp_path_factory):
+    """Read-only layout with a git repo and a sibling non-repo directory."""
+    root = tmp_path_factory.mktemp("repo_skeleton")
+    (root / "repo" / ".git").mkdir(parents=True)
+    (root / "repo" / "a" / "b" / "c").mkdir(parents=True)
+    (root / "not-a-repo").mkdir()
+    return root
 
-    def test_find_repo_root(self, tmp_path, monkeypatch):
-        """Find git repository root."""
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / ".git").mkdir()
 
-        root = find_repo_root()
-        assert root == tmp_path
+class TestFindRepoRoot:
+    """Tests for find_repo_root function."""
 
-    def test_find_from_subdir(self, tmp_path, monkeypatch):
-        """Find repo root from subdirectory."""
-        (tmp_path / ".git").mkdir()
-        subdir = tmp_path / "a" / "b" / "c"
-        subdir.mkdir(parents=True)
-        monkeypatch.chdir(subdir)
+    @pytest.mark.parametrize(
+        "subdir", ["", "a", "a/b/c"], ids=["root", "child", "nested"]
+    )
+    def test_find_repo_root(self, repo_skeleton, subdir):
+        """Find git repository root from the root or any subdirectory."""
+        repo = repo_skeleton / "repo"
 
-        root = find_repo_root()
-        assert root == tmp_path
+        root = find_repo_root(repo / subdir)
+        assert root == repo
 
-    def test_not_in_repo(self, tmp_path, monkeypatch):
+    def test_not_in_repo(self, repo_skeleton):
         """Returns None when not in a git repo."""
+        root = find_repo_root(repo_skeleton / "not-a-repo")
+        assert root is None
+
+    def test_defaults_to_cwd(self, tmp_path, monkeypatch):
+        """Searches from the current directory when no start path is given."""
+        (tmp_path / ".git").mkdir()
         monkeypatch.chdir(tmp_path)
 
-        root = find_repo_root()
-        assert root is None
+        assert find_repo_root() == tmp_path
 
 
 class TestGetOrCreateConfig:
     """Tests for get_or_create_config function."""
 
-    def test_creates_new(self, tmp_path, monkeypatch):
+    def test_creates_new(self, tmp_path):
         """Creates new config if none exists."""
-        monkeypatch.chdir(tmp_path)
-
-        path, config = get_or_create_config()
+        path, config = get_or_create_config(tmp_path)
         assert path == tmp_path / "agr.toml"
         assert path.exists()
         assert config.dependencies == []
 
-    def test_returns_existing(self, tmp_path, monkeypatch):
+    def test_returns_existing(self, tmp_path):
         """Returns existing config."""
-        monkeypatch.chdir(tmp_path)
         config_path = tmp_path / "agr.toml"
         config_path.write_text("""
 dependencies = [
@@ -217,7 +273,7 @@ dependencies = [
 ]
 """)
 
-        path, config = get_or_create_config()
+        path, config = get_or_create_config(tmp_path)
         assert path == config_path
         assert len(config.dependencies) == 1
 
@@ -2,7 +2,6 @@
 
 from pathlib import Path
 
-
 from agr.config import AgrConfig
 from agr.fetcher import (
     install_local_skill,
@@ -12,6 +11,16 @@ from agr.handle import ParsedHandle
 from agr.skill import SKILL_MARKER
 from agr.tool import CLAUDE, COPILOT, CURSOR, get_tool
 
+# Expected skills dirs relative to a repo root or home directory
+GITHUB_SKILLS = Path(".github", "skills")
+COPILOT_SKILLS = Path(".copilot", "skills")
+CLAUDE_SKILLS = Path(".claude", "skills")
+CURSOR_SKILLS = Path(".cursor", "skills")
+
+# Path computations are pure, so these tests never need a real directory
+FAKE_HOME = Path("/home/tester")
+FAKE_REPO = Path("/work/repo")
+
 
 class TestCopilotToolConfig:
     """Tests for Copilot tool configuration."""
@@ -33,29 +42,23 @@ class TestCopilotToolConfig:
         tool = get_tool("copilot")
         assert tool == COPILOT
 
-    def test_copilot_project_skills_dir(self, tmp_path):
+    def test_copilot_project_skills_dir(self):
         """Copilot project skills go to .github/skills/."""
-        repo_root = tmp_path / "repo"
-        repo_root.mkdir()
+        skills_dir = COPILOT.get_skills_dir(FAKE_REPO)
+        assert skills_dir == FAKE_REPO / GITHUB_SKILLS
 
-        skills_dir = COPILOT.get_skills_dir(repo_root)
-        assert skills_dir == repo_root / ".github" / "skills"
-
-    def test_copilot_global_skills_dir(self, monkeypatch, tmp_path):
+    def test_copilot_global_skills_dir(self, monkeypatch):
         """Copilot personal skills go to ~/.copilot/skills/."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        monkeypatch.setattr(Path, "home", lambda: FAKE_HOME)
 
         global_dir = COPILOT.get_global_skills_dir()
-        assert global_dir == tmp_path / ".copilot" / "skills"
+        assert global_dir == FAKE_HOME / COPILOT_SKILLS
 
-    def test_copilot_global_dir_differs_from_project(self, monkeypatch, tmp_path):
+    def test_copilot_global_dir_differs_from_project(self, monkeypatch):
         """Copilot global path (~/.copilot/) differs from project path (.github/)."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-
-        repo_root = tmp_path / "repo"
-        repo_root.mkdir()
+        monkeypatch.setattr(Path, "home", lambda: FAKE_HOME)
 
-        project_dir = COPILOT.get_skills_dir(repo_root)
+        project_dir = COPILOT.get_skills_dir(FAKE_REPO)
         global_dir = COPILOT.get_global_skills_dir()
 
         # Project uses .github
@@ -130,7 +133,7 @@ class TestCopilotInstallation:
 
     def test_install_local_skill_to_copilot(self, tmp_path, skill_fixture):
         """Install a local skill with flat structure."""
-        dest_dir = tmp_path / ".github" / "skills"
+        dest_dir = tmp_path / GITHUB_SKILLS
         dest_dir.mkdir(parents=True)
 
         installed_path = install_local_skill(skill_fixture, dest_dir, COPILOT)
@@ -142,7 +145,7 @@ class TestCopilotInstallation:
 
     def test_install_creates_flat_structure(self, tmp_path, skill_fixture):
         """Flat installation creates single-level directory."""
-        dest_dir = tmp_path / ".github" / "skills"
+        dest_dir = tmp_path / GITHUB_SKILLS
         dest_dir.mkdir(parents=True)
 
         install_local_skill(skill_fixture, dest_dir, COPILOT)
@@ -158,12 +161,12 @@ class TestCopilotVsClaude:
     def test_both_flat_same_structure(self, tmp_path, skill_fixture):
         """Both Claude and Copilot create same flat structure."""
         # Install to Claude
-        claude_skills = tmp_path / ".claude" / "skills"
+        claude_skills = tmp_path / CLAUDE_SKILLS
         claude_skills.mkdir(parents=True)
         claude_path = install_local_skill(skill_fixture, claude_skills, CLAUDE)
 
         # Install to Copilot
-        copilot_skills = tmp_path / ".github" / "skills"
+        copilot_skills = tmp_path / GITHUB_SKILLS
         copilot_skills.mkdir(parents=True)
         copilot_path = install_local_skill(skill_fixture, copilot_skills, COPILOT)
 
@@ -175,12 +178,9 @@ class TestCopilotVsClaude:
 class TestCopilotIsSkillInstalled:
     """Tests for is_skill_installed with Copilot."""
 
-    def test_check_copilot_skill(self, tmp_path, skill_fixture):
+    def test_check_copilot_skill(self, repo_root, skill_fixture):
         """Check if Copilot skill is installed."""
-        repo_root = tmp_path / "repo"
-        repo_root.mkdir()
-        (repo_root / ".git").mkdir()
-        skills_dir = repo_root / ".github" / "skills"
+        skills_dir = repo_root / GITHUB_SKILLS
         skills_dir.mkdir(parents=True)
 
         install_local_skill(skill_fixture, skills_dir, COPILOT)
@@ -236,18 +236,18 @@ dependencies = []
 class TestGlobalConfigDirBackwardsCompatibility:
     """Tests that global_config_dir doesn't break existing tools."""
 
-    def test_claude_global_dir_unchanged(self, monkeypatch, tmp_path):
+    def test_claude_global_dir_unchanged(self, monkeypatch):
         """Claude global dir still uses .claude (no global_config_dir set)."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        monkeypatch.setattr(Path, "home", lambda: FAKE_HOME)
 
         assert CLAUDE.global_config_dir is None
         global_dir = CLAUDE.get_global_skills_dir()
-        assert global_dir == tmp_path / ".claude" / "skills"
+        assert global_dir == FAKE_HOME / CLAUDE_SKILLS
 
-    def test_cursor_global_dir_unchanged(self, monkeypatch, tmp_path):
+    def test_cursor_global_dir_unchanged(self, monkeypatch):
         """Cursor global dir still uses .cursor (no global_config_dir set)."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        monkeypatch.setattr(Path, "home", lambda: FAKE_HOME)
 
         assert CURSOR.global_config_dir is None
         global_dir = CURSOR.get_global_skills_dir()
-        assert global_dir == tmp_path / ".cursor" / "skills"
+        assert global_dir == FAKE_HOME / CURSOR_SKILLS
@@ -5,6 +5,7 @@ from pathlib import Path
 import pytest
 
 from agr.config import AgrConfig
+from agr.exceptions import AgrError
 from agr.fetcher import (
     fetch_and_install,
     get_installed_skills,
@@ -40,68 +41,60 @@ class TestToolConfig:
 
     def test_get_tool_unknown_raises(self):
         """Getting unknown tool raises."""
-        from agr.exceptions import AgrError
-
         with pytest.raises(AgrError, match="Unknown tool"):
             get_tool("unknown")
 
 
-class TestNestedPaths:
-    """Tests for nested path generation."""
-
-    def test_remote_skill_flat_path(self):
-        """Remote skill gets flat path for Claude."""
-        h = ParsedHandle(username="maragudk", repo="skills", name="collab")
-        assert h.to_skill_path(CLAUDE) == Path("maragudk--skills--collab")
+REMOTE = {"username": "maragudk", "repo": "skills", "name": "collab"}
+REMOTE_NO_REPO = {"username": "kasperjunge", "name": "commit"}
+LOCAL = {"is_local": True, "name": "my-skill"}
 
-    def test_remote_skill_nested_path(self):
-        """Remote skill gets nested path for Cursor."""
-        h = ParsedHandle(username="maragudk", repo="skills", name="collab")
-        assert h.to_skill_path(CURSOR) == Path("maragudk/skills/collab")
 
-    def test_remote_skill_no_repo_flat(self):
-        """Remote skill without repo gets flat path for Claude."""
-        h = ParsedHandle(username="kasperjunge", name="commit")
-        assert h.to_skill_path(CLAUDE) == Path("kasperjunge--commit")
-
-    def test_remote_skill_no_repo_nested(self):
-        """Remote skill without repo gets nested path for Cursor."""
-        h = ParsedHandle(username="kasperjunge", name="commit")
-        assert h.to_skill_path(CURSOR) == Path("kasperjunge/commit")
-
-    def test_local_skill_flat_path(self):
-        """Local skill gets flat path for Claude."""
-        h = ParsedHandle(is_local=True, name="my-skill")
-        assert h.to_skill_path(CLAUDE) == Path("local--my-skill")
+class TestNestedPaths:
+    """Tests for nested path generation."""
 
-    def test_local_skill_nested_path(self):
-        """Local skill gets nested path for Cursor."""
-        h = ParsedHandle(is_local=True, name="my-skill")
-        assert h.to_skill_path(CURSOR) == Path("local/my-skill")
+    @pytest.mark.parametrize(
+        "handle_kwargs,tool,expected",
+        [
+            (REMOTE, CLAUDE, "maragudk--skills--collab"),
+            (REMOTE, CURSOR, "maragudk/skills/collab"),
+            (REMOTE_NO_REPO, CLAUDE, "kasperjunge--commit"),
+            (REMOTE_NO_REPO, CURSOR, "kasperjunge/commit"),
+            (LOCAL, CLAUDE, "local--my-skill"),
+            (LOCAL, CURSOR, "local/my-skill"),
+        ],
+        ids=[
+            "remote-flat",
+            "remote-nested",
+            "no-repo-flat",
+            "no-repo-nested",
+            "local-flat",
+            "local-nested",
+        ],
+    )
+    def test_skill_path(self, handle_kwargs, tool, expected):
+        """Flat tools join with --, nested tools use directories."""
+        h = ParsedHandle(**handle_kwargs)
+        assert h.to_skill_path(tool) == Path(expected)
 
 
 class TestSkillNameForTool:
     """Tests for SKILL.md name field based on tool."""
 
-    def test_skill_name_flat(self):
-        """Flat tools get full installed name."""
-        h = ParsedHandle(username="maragudk", repo="skills", name="collab")
-        assert h.get_skill_name_for_tool(CLAUDE) == "maragudk--skills--collab"
-
-    def test_skill_name_nested(self):
-        """Nested tools get just the skill name."""
-        h = ParsedHandle(username="maragudk", repo="skills", name="collab")
-        assert h.get_skill_name_for_tool(CURSOR) == "collab"
-
-    def test_local_skill_name_flat(self):
-        """Local skills get prefixed name for flat tools."""
-        h = ParsedHandle(is_local=True, name="my-skill")
-        assert h.get_skill_name_for_tool(CLAUDE) == "local--my-skill"
-
-    def test_local_skill_name_nested(self):
-        """Local skills get just the name for nested tools."""
-        h = ParsedHandle(is_local=True, name="my-skill")
-        assert h.get_skill_name_for_tool(CURSOR) == "my-skill"
+    @pytest.mark.parametrize(
+        "handle_kwargs,tool,expected",
+        [
+            (REMOTE, CLAUDE, "maragudk--skills--collab"),
+            (REMOTE, CURSOR, "collab"),
+            (LOCAL, CLAUDE, "local--my-skill"),
+            (LOCAL, CURSOR, "my-skill"),
+        ],
+        ids=["remote-flat", "remote-nested", "local-flat", "local-nested"],
+    )
+    def test_skill_name(self, handle_kwargs, tool, expected):
+        """Flat tools get the full installed name, nested tools the bare name."""
+        h = ParsedHandle(**handle_kwargs)
+        assert h.get_skill_name_for_tool(tool) == expected
 
 
 class TestCursorInstallation:
@@ -134,11 +127,8 @@ class TestCursorInstallation:
 class TestCursorUninstallation:
     """Tests for uninstalling skills from Cursor."""
 
-    def test_uninstall_cleans_empty_parents(self, tmp_path, skill_fixture):
+    def test_uninstall_cleans_empty_parents(self, repo_root, skill_fixture):
         """Uninstalling from Cursor cleans up empty parent directories."""
-        repo_root = tmp_path / "repo"
-        repo_root.mkdir()
-        (repo_root / ".git").mkdir()
         skills_dir = repo_root / ".cursor" / "skills"
         skills_dir.mkdir(parents=True)
 
@@ -163,12 +153,8 @@ class TestCursorUninstallation:
 class TestMultiToolInstallation:
     """Tests for installing to multiple tools."""
 
-    def test_install_to_both_tools(self, tmp_path, skill_fixture):
+    def test_install_to_both_tools(self, repo_root, skill_fixture):
         """Installing to both Claude and Cursor creates different structures."""
-        repo_root = tmp_path / "repo"
-        repo_root.mkdir()
-        (repo_root / ".git").mkdir()
-
         # Install to Claude
         claude_skills = repo_root / ".claude" / "skills"
         claude_skills.mkdir(parents=True)
@@ -193,11 +179,8 @@ class TestMultiToolInstallation:
 class TestGetInstalledSkillsNested:
     """Tests for get_installed_skills with nested structures."""
 
-    def test_get_nested_skills(self, tmp_path, skill_fixture):
+    def test_get_nested_skills(self, repo_root, skill_fixture):
         """Get installed skills from nested structure."""
-        repo_root = tmp_path / "repo"
-        repo_root.mkdir()
-        (repo_root / ".git").mkdir()
         skills_dir = repo_root / ".cursor" / "skills"
         skills_dir.mkdir(parents=True)
 
@@ -211,11 +194,8 @@ class TestGetInstalledSkillsNested:
 class TestIsSkillInstalledNested:
     """Tests for is_skill_installed with nested structures."""
 
-    def test_check_nested_skill(self, tmp_path, skill_fixture):
+    def test_check_nested_skill(self, repo_root, skill_fixture):
         """Check if nested skill is installed."""
-        repo_root = tmp_path / "repo"
-        repo_root.mkdir()
-        (repo_root / ".git").mkdir()
         skills_dir = repo_root / ".cursor" / "skills"
         skills_dir.mkdir(parents=True)
 
@@ -230,7 +210,7 @@ class TestIsSkillInstalledNested:
 class TestConfigTools:
     """Tests for tools field in config."""
 
-    def test_default_tools(self, tmp_path):
+    def test_default_tools(self):
         """Default tools is just Claude."""
         config = AgrConfig()
         assert config.tools == ["claude"]
@@ -274,12 +254,8 @@ dependencies = []
 class TestFetchAndInstallWithTool:
     """Tests for fetch_and_install with tool parameter."""
 
-    def test_fetch_local_with_cursor(self, tmp_path, skill_fixture):
+    def test_fetch_local_with_cursor(self, repo_root, skill_fixture):
         """Fetch and install local skill to Cursor."""
-        repo_root = tmp_path / "repo"
-        repo_root.mkdir()
-        (repo_root / ".git").mkdir()
-
         handle = ParsedHandle(
             is_local=True, name=skill_fixture.name, local_path=skill_fixture
         )
@@ -300,7 +276,7 @@ class TestSeparatorInNestedTool:
         # Create a skill with -- in its name
         bad_for_claude = tmp_path / "my--special--skill"
         bad_for_claude.mkdir()
-        (bad_for_claude / SKILL_MARKER).write_text("# Special Skill")
+        (bad_for_claude / SKILL_MARKER).touch()
 
         dest_dir = tmp_path / ".cursor" / "skills"
         dest_dir.mkdir(parents=True)
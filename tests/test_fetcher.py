@@ -1,5 +1,13 @@
 """Tests for agr.fetcher module."""
 
+import io
+import os
+import subprocess
+import sys
+import tarfile
+from contextlib import nullcontext
+
+import httpx
 import pytest
 import respx
 from httpx import Response
@@ -7,13 +15,16 @@ from httpx import Response
 from agr.exceptions import (
     AgrError,
     AuthenticationError,
+    InstallPermissionError,
     RepoNotFoundError,
     SkillNotFoundError,
 )
 from agr.fetcher import (
     _cleanup_empty_parents,
+    _get_client,
     _get_github_token,
     downloaded_repo,
+    ensure_writable,
     fetch_and_install_to_tools,
     get_installed_skills,
     install_local_skill,
@@ -24,6 +35,34 @@ from agr.handle import ParsedHandle
 from agr.skill import SKILL_MARKER
 from agr.tool import CLAUDE, CURSOR
 
+# Authenticated downloads use github.com; anonymous ones go straight to codeload
+ARCHIVE_URL = "https://github.com/user/repo/archive/refs/heads/main.tar.gz"
+CODELOAD_URL = "https://codeload.github.com/user/repo/tar.gz/refs/heads/main"
+
+
+def _deny_writes(path):
+    """Stand-in for ensure_writable that treats every location as read-only."""
+    raise InstallPermissionError(f"Cannot write to {path}: permission denied")
+
+
+def _tarball(files: dict[str, bytes], symlinks: dict[str, str] | None = None) -> bytes:
+    """Build an in-memory .tar.gz from member names to content.
+
+    Symlinks (member name to link target) are added first, in order.
+    """
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        for name, target in (symlinks or {}).items():
+            info = tarfile.TarInfo(name)
+            info.type = tarfile.SYMTYPE
+            info.linkname = target
+            tar.addfile(info)
+        for name, content in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+    return buffer.getvalue()
+
 
 class TestGitHubAuthentication:
     """Tests for GitHub token authentication."""
@@ -70,9 +109,7 @@ class TestGitHubAuthentication:
         monkeypatch.setenv("GITHUB_TOKEN", "test_token")
         monkeypatch.delenv("GH_TOKEN", raising=False)
 
-        route = respx.get(
-            "https://github.com/user/repo/archive/refs/heads/main.tar.gz"
-        ).mock(return_value=Response(404))
+        route = respx.get(ARCHIVE_URL).mock(return_value=Response(404))
 
         with pytest.raises(RepoNotFoundError):
             with downloaded_repo("user", "repo"):
@@ -87,9 +124,7 @@ class TestGitHubAuthentication:
         monkeypatch.delenv("GITHUB_TOKEN", raising=False)
         monkeypatch.delenv("GH_TOKEN", raising=False)
 
-        route = respx.get(
-            "https://github.com/user/repo/archive/refs/heads/main.tar.gz"
-        ).mock(return_value=Response(404))
+        route = respx.get(CODELOAD_URL).mock(return_value=Response(404))
 
         with pytest.raises(RepoNotFoundError):
             with downloaded_repo("user", "repo"):
@@ -98,15 +133,29 @@ class TestGitHubAuthentication:
         assert route.called
         assert "Authorization" not in route.calls[0].request.headers
 
+    @respx.mock
+    def test_downloads_share_one_client(self, monkeypatch):
+        """Repeated downloads reuse the process-wide HTTP client."""
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        monkeypatch.delenv("GH_TOKEN", raising=False)
+        respx.get(CODELOAD_URL).mock(return_value=Response(404))
+        client = _get_client()
+
+        for _ in range(2):
+            with pytest.raises(RepoNotFoundError):
+                with downloaded_repo("user", "repo"):
+                    pass
+
+        assert _get_client() is client
+        assert not client.is_closed
+
     @respx.mock
     def test_401_without_token_suggests_setting_token(self, monkeypatch):
         """401 without token suggests setting GITHUB_TOKEN."""
         monkeypatch.delenv("GITHUB_TOKEN", raising=False)
         monkeypatch.delenv("GH_TOKEN", raising=False)
 
-        respx.get("https://github.com/user/repo/archive/refs/heads/main.tar.gz").mock(
-            return_value=Response(401)
-        )
+        respx.get(CODELOAD_URL).mock(return_value=Response(401))
 
         with pytest.raises(AuthenticationError, match="Set GITHUB_TOKEN"):
             with downloaded_repo("user", "repo"):
@@ -118,9 +167,7 @@ class TestGitHubAuthentication:
         monkeypatch.setenv("GITHUB_TOKEN", "bad_token")
         monkeypatch.delenv("GH_TOKEN", raising=False)
 
-        respx.get("https://github.com/user/repo/archive/refs/heads/main.tar.gz").mock(
-            return_value=Response(401)
-        )
+        respx.get(ARCHIVE_URL).mock(return_value=Response(401))
 
         with pytest.raises(AuthenticationError, match="is valid"):
             with downloaded_repo("user", "repo"):
@@ -132,9 +179,7 @@ class TestGitHubAuthentication:
         monkeypatch.setenv("GITHUB_TOKEN", "token_without_scope")
         monkeypatch.delenv("GH_TOKEN", raising=False)
 
-        respx.get("https://github.com/user/repo/archive/refs/heads/main.tar.gz").mock(
-            return_value=Response(403)
-        )
+        respx.get(ARCHIVE_URL).mock(return_value=Response(403))
 
         with pytest.raises(AuthenticationError, match="repo.*scope"):
             with downloaded_repo("user", "repo"):
@@ -146,9 +191,7 @@ class TestGitHubAuthentication:
         monkeypatch.delenv("GITHUB_TOKEN", raising=False)
         monkeypatch.delenv("GH_TOKEN", raising=False)
 
-        respx.get("https://github.com/user/repo/archive/refs/heads/main.tar.gz").mock(
-            return_value=Response(403)
-        )
+        respx.get(CODELOAD_URL).mock(return_value=Response(403))
 
         with pytest.raises(AuthenticationError, match="Set GITHUB_TOKEN"):
             with downloaded_repo("user", "repo"):
@@ -160,9 +203,7 @@ class TestGitHubAuthentication:
         monkeypatch.delenv("GITHUB_TOKEN", raising=False)
         monkeypatch.delenv("GH_TOKEN", raising=False)
 
-        respx.get("https://github.com/user/repo/archive/refs/heads/main.tar.gz").mock(
-            return_value=Response(429)
-        )
+        respx.get(CODELOAD_URL).mock(return_value=Response(429))
 
         with pytest.raises(AgrError, match="rate limit"):
             with downloaded_repo("user", "repo"):
@@ -175,9 +216,7 @@ class TestGitHubAuthentication:
         monkeypatch.setenv("GITHUB_TOKEN", secret_token)
         monkeypatch.delenv("GH_TOKEN", raising=False)
 
-        respx.get("https://github.com/user/repo/archive/refs/heads/main.tar.gz").mock(
-            return_value=Response(500)
-        )
+        respx.get(ARCHIVE_URL).mock(return_value=Response(500))
 
         with pytest.raises(AgrError) as exc_info:
             with downloaded_repo("user", "repo"):
@@ -208,12 +247,10 @@ class TestGitHubAuthentication:
     @respx.mock
     def test_connect_error_raises_agr_error(self, monkeypatch):
         """Connection errors wrapped in AgrError."""
-        import httpx
-
         monkeypatch.delenv("GITHUB_TOKEN", raising=False)
         monkeypatch.delenv("GH_TOKEN", raising=False)
 
-        respx.get("https://github.com/user/repo/archive/refs/heads/main.tar.gz").mock(
+        respx.get(CODELOAD_URL).mock(
             side_effect=httpx.ConnectError("Connection refused")
         )
 
@@ -224,14 +261,10 @@ class TestGitHubAuthentication:
     @respx.mock
     def test_timeout_error_raises_agr_error(self, monkeypatch):
         """Timeout errors wrapped in AgrError."""
-        import httpx
-
         monkeypatch.delenv("GITHUB_TOKEN", raising=False)
         monkeypatch.delenv("GH_TOKEN", raising=False)
 
-        respx.get("https://github.com/user/repo/archive/refs/heads/main.tar.gz").mock(
-            side_effect=httpx.ReadTimeout("Read timed out")
-        )
+        respx.get(CODELOAD_URL).mock(side_effect=httpx.ReadTimeout("Read timed out"))
 
         with pytest.raises(AgrError, match="Network error: ReadTimeout"):
             with downloaded_repo("user", "repo"):
@@ -243,9 +276,7 @@ class TestGitHubAuthentication:
         monkeypatch.delenv("GITHUB_TOKEN", raising=False)
         monkeypatch.delenv("GH_TOKEN", raising=False)
 
-        respx.get("https://github.com/user/repo/archive/refs/heads/main.tar.gz").mock(
-            return_value=Response(500)
-        )
+        respx.get(CODELOAD_URL).mock(return_value=Response(500))
 
         with pytest.raises(AgrError, match="HTTP 500"):
             with downloaded_repo("user", "repo"):
@@ -257,15 +288,81 @@ class TestGitHubAuthentication:
         monkeypatch.delenv("GITHUB_TOKEN", raising=False)
         monkeypatch.delenv("GH_TOKEN", raising=False)
 
-        respx.get("https://github.com/user/repo/archive/refs/heads/main.tar.gz").mock(
-            return_value=Response(502)
-        )
+        respx.get(CODELOAD_URL).mock(return_value=Response(502))
 
         with pytest.raises(AgrError, match="HTTP 502"):
             with downloaded_repo("user", "repo"):
                 pass
 
 
+class TestTarballExtraction:
+    """Tests for streaming tarball extraction in downloaded_repo."""
+
+    @pytest.fixture(params=["data-filter", "fallback"])
+    def extraction_mode(self, request, monkeypatch):
+        """Run extraction tests with and without tarfile's data filter."""
+        if request.param == "fallback":
+            monkeypatch.delattr(tarfile, "data_filter", raising=False)
+        elif not hasattr(tarfile, "data_filter"):
+            pytest.skip("tarfile extraction filters not available")
+        return request.param
+
+    @respx.mock
+    def test_streams_tarball_into_repo_dir(self, monkeypatch, extraction_mode):
+        """The archive is extracted straight from the response body."""
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        monkeypatch.delenv("GH_TOKEN", raising=False)
+        respx.get(CODELOAD_URL).mock(
+            return_value=Response(
+                200, content=_tarball({f"repo-main/skill/{SKILL_MARKER}": b"# Skill"})
+            )
+        )
+
+        with downloaded_repo("user", "repo") as repo_dir:
+            assert repo_dir.name == "repo-main"
+            assert (repo_dir / "skill" / SKILL_MARKER).read_bytes() == b"# Skill"
+
+    @pytest.mark.parametrize("name", ["../evil.txt", "repo-main/../../evil.txt"])
+    @respx.mock
+    def test_path_traversal_member_rejected(self, monkeypatch, extraction_mode, name):
+        """Members escaping the extraction directory abort the download."""
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        monkeypatch.delenv("GH_TOKEN", raising=False)
+        respx.get(CODELOAD_URL).mock(
+            return_value=Response(200, content=_tarball({name: b"x"}))
+        )
+
+        with pytest.raises(AgrError, match="Failed to extract"):
+            with downloaded_repo("user", "repo"):
+                pass
+
+    @respx.mock
+    def test_symlink_chain_escape_rejected(self, monkeypatch, extraction_mode):
+        """Links that only escape once resolved through other links are refused.
+
+        "b/c/../../.." normalizes to repo-main itself, but b/c is a link to
+        repo-main/q, so a really resolves to the directory above dest.
+        """
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        monkeypatch.delenv("GH_TOKEN", raising=False)
+        respx.get(CODELOAD_URL).mock(
+            return_value=Response(
+                200,
+                content=_tarball(
+                    {"repo-main/a/escaped.txt": b"x"},
+                    symlinks={
+                        "repo-main/b/c": "../q",
+                        "repo-main/a": "b/c/../../..",
+                    },
+                ),
+            )
+        )
+
+        with pytest.raises(AgrError, match="Failed to extract"):
+            with downloaded_repo("user", "repo"):
+                pass
+
+
 class TestInstallLocalSkill:
     """Tests for install_local_skill function."""
 
@@ -317,12 +414,10 @@ class TestInstallLocalSkill:
 
     def test_install_rejects_separator_in_name(self, tmp_path):
         """Installing skill with reserved separator in name raises."""
-        from agr.skill import SKILL_MARKER
-
         # Create a skill with -- in its name
         bad_skill = tmp_path / "my--bad--skill"
         bad_skill.mkdir()
-        (bad_skill / SKILL_MARKER).write_text("# Bad Skill")
+        (bad_skill / SKILL_MARKER).touch()
 
         dest_dir = tmp_path / ".claude" / "skills"
         dest_dir.mkdir(parents=True)
@@ -334,12 +429,9 @@ class TestInstallLocalSkill:
 class TestUninstallSkill:
     """Tests for uninstall_skill function."""
 
-    def test_uninstall_existing(self, tmp_path, skill_fixture):
+    def test_uninstall_existing(self, repo_root, skill_fixture):
         """Uninstall an existing skill."""
         # Set up repo structure
-        repo_root = tmp_path / "repo"
-        repo_root.mkdir()
-        (repo_root / ".git").mkdir()
         skills_dir = repo_root / ".claude" / "skills"
         skills_dir.mkdir(parents=True)
 
@@ -357,12 +449,8 @@ class TestUninstallSkill:
         assert removed
         assert not installed_path.exists()
 
-    def test_uninstall_nonexistent(self, tmp_path):
+    def test_uninstall_nonexistent(self, repo_root):
         """Uninstalling nonexistent returns False."""
-        repo_root = tmp_path / "repo"
-        repo_root.mkdir()
-        (repo_root / ".git").mkdir()
-
         handle = ParsedHandle(is_local=True, name="nonexistent-skill")
         removed = uninstall_skill(handle, repo_root, CLAUDE)
         assert not removed
@@ -371,20 +459,13 @@ class TestUninstallSkill:
 class TestGetInstalledSkills:
     """Tests for get_installed_skills function."""
 
-    def test_no_skills_dir(self, tmp_path):
+    def test_no_skills_dir(self, repo_root):
         """Returns empty list when skills dir doesn't exist."""
-        repo_root = tmp_path / "repo"
-        repo_root.mkdir()
-        (repo_root / ".git").mkdir()
-
         skills = get_installed_skills(repo_root, CLAUDE)
         assert skills == []
 
-    def test_with_skills(self, tmp_path, skill_fixture):
+    def test_with_skills(self, repo_root, skill_fixture):
         """Returns list of installed skill names."""
-        repo_root = tmp_path / "repo"
-        repo_root.mkdir()
-        (repo_root / ".git").mkdir()
         skills_dir = repo_root / ".claude" / "skills"
         skills_dir.mkdir(parents=True)
 
@@ -398,11 +479,8 @@ class TestGetInstalledSkills:
 class TestIsSkillInstalled:
     """Tests for is_skill_installed function."""
 
-    def test_installed(self, tmp_path, skill_fixture):
+    def test_installed(self, repo_root, skill_fixture):
         """Returns True for installed skill."""
-        repo_root = tmp_path / "repo"
-        repo_root.mkdir()
-        (repo_root / ".git").mkdir()
         skills_dir = repo_root / ".claude" / "skills"
         skills_dir.mkdir(parents=True)
 
@@ -414,16 +492,66 @@ class TestIsSkillInstalled:
         )
         assert is_skill_installed(handle, repo_root, CLAUDE)
 
-    def test_not_installed(self, tmp_path):
+    def test_not_installed(self, repo_root):
         """Returns False for non-installed skill."""
-        repo_root = tmp_path / "repo"
-        repo_root.mkdir()
-        (repo_root / ".git").mkdir()
-
         handle = ParsedHandle(is_local=True, name="nonexistent-skill")
         assert not is_skill_installed(handle, repo_root, CLAUDE)
 
 
+# Modules only needed once a download starts; importing the CLI must not load them
+LAZY_MODULES = ("httpx", "tarfile")
+
+
+class TestLazyImports:
+    """Tests that download-only dependencies load on first download."""
+
+    @pytest.mark.parametrize("module", ["agr.fetcher", "agr.main"])
+    def test_import_does_not_load_download_modules(self, module):
+        """Importing the fetcher, or the CLI with every command, stays light."""
+        code = (
+            f"import sys, {module}; "
+            f"leaked = [m for m in {LAZY_MODULES!r} if m in sys.modules]; "
+            "sys.exit(', '.join(leaked) or None)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True)
+        assert result.returncode == 0, result.stderr.decode()
+
+
+def _import_time_us(module: str) -> int:
+    """Total self import time, in microseconds, of importing module afresh."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:"):
+            self_us = line.removeprefix("import time:").split("|")[0].strip()
+            if self_us.isdigit():
+                total += int(self_us)
+    return total
+
+
+@pytest.mark.slow
+class TestImportBudget:
+    """Tests that import time stays within a generous budget.
+
+    Wall-clock timings vary with machine load, so these are opt-in
+    (marked slow). TestLazyImports guards the import graph in default runs;
+    this catches startup cost creeping up across many small changes.
+    """
+
+    @pytest.mark.parametrize(
+        "module,budget_us",
+        [("agr.fetcher", 600_000), ("agr.main", 1_000_000)],
+    )
+    def test_import_within_budget(self, module, budget_us):
+        """Importing the fetcher and the full CLI stays under budget."""
+        assert _import_time_us(module) < budget_us
+
+
 class TestDownloadedRepo:
     """Tests for downloaded_repo context manager.
 
@@ -433,8 +561,6 @@ class TestDownloadedRepo:
     @pytest.mark.e2e
     def test_download_existing_repo(self):
         """Download a real repository."""
-        from agr.fetcher import downloaded_repo
-
         with downloaded_repo("kasperjunge", "agent-resources") as repo_dir:
             assert repo_dir.exists()
             # Should have agr.toml or pyproject.toml
@@ -445,9 +571,6 @@ class TestDownloadedRepo:
     @pytest.mark.e2e
     def test_download_nonexistent_raises(self):
         """Downloading nonexistent repo raises."""
-        from agr.exceptions import RepoNotFoundError
-        from agr.fetcher import downloaded_repo
-
         with pytest.raises(RepoNotFoundError):
             with downloaded_repo("nonexistent-user-12345", "nonexistent-repo-67890"):
                 pass
@@ -511,12 +634,8 @@ class TestCleanupEmptyParents:
 class TestFetchAndInstallToTools:
     """Tests for fetch_and_install_to_tools function."""
 
-    def test_local_skill_to_multiple_tools(self, tmp_path, skill_fixture):
+    def test_local_skill_to_multiple_tools(self, repo_root, skill_fixture):
         """Local skill installs to multiple tools."""
-        repo_root = tmp_path / "repo"
-        repo_root.mkdir()
-        (repo_root / ".git").mkdir()
-
         handle = ParsedHandle(
             is_local=True, name=skill_fixture.name, local_path=skill_fixture
         )
@@ -534,17 +653,13 @@ class TestFetchAndInstallToTools:
         # Cursor uses nested directories
         assert results["cursor"].parent.name == "local"
 
-    def test_rollback_on_partial_failure(self, tmp_path, skill_fixture):
+    def test_rollback_on_partial_failure(self, repo_root, skill_fixture):
         """If second tool fails, first tool installation is rolled back."""
-        repo_root = tmp_path / "repo"
-        repo_root.mkdir()
-        (repo_root / ".git").mkdir()
-
         # Pre-install to cursor so it will fail without overwrite
         cursor_skills = repo_root / ".cursor" / "skills" / "local"
         cursor_skills.mkdir(parents=True)
         (cursor_skills / skill_fixture.name).mkdir()
-        (cursor_skills / skill_fixture.name / "SKILL.md").write_text("# existing")
+        (cursor_skills / skill_fixture.name / "SKILL.md").touch()
 
         handle = ParsedHandle(
             is_local=True, name=skill_fixture.name, local_path=skill_fixture
@@ -560,15 +675,110 @@ class TestFetchAndInstallToTools:
         claude_path = repo_root / ".claude" / "skills" / f"local--{skill_fixture.name}"
         assert not claude_path.exists()
 
-    def test_empty_tools_list_raises(self, tmp_path, skill_fixture):
+    def test_empty_tools_list_raises(self, repo_root, skill_fixture):
         """Empty tools list raises ValueError."""
-        repo_root = tmp_path / "repo"
-        repo_root.mkdir()
-        (repo_root / ".git").mkdir()
-
         handle = ParsedHandle(
             is_local=True, name=skill_fixture.name, local_path=skill_fixture
         )
 
         with pytest.raises(ValueError, match="No tools provided"):
             fetch_and_install_to_tools(handle, repo_root, [], overwrite=False)
+
+    @respx.mock(assert_all_mocked=True)
+    def test_remote_installs_from_provided_repo_dir(self, repo_root, tmp_path):
+        """A pre-downloaded repo_dir is used instead of fetching from GitHub."""
+        repo_dir = tmp_path / "repo-main"
+        (repo_dir / "skills" / "commit").mkdir(parents=True)
+        (repo_dir / "skills" / "commit" / SKILL_MARKER).write_text("# Commit")
+        handle = ParsedHandle(username="user", repo="repo", name="commit")
+
+        results = fetch_and_install_to_tools(
+            handle, repo_root, [CLAUDE], overwrite=False, repo_dir=repo_dir
+        )
+
+        assert (results["claude"] / SKILL_MARKER).exists()
+        assert not respx.calls
+
+    def test_remote_install_links_files_but_copies_skill_md(
+        self, repo_root, tmp_path, monkeypatch
+    ):
+        """One tool links files out of the extraction; tools never share inodes."""
+        skill_src = tmp_path / "repo-main" / "commit"
+        (skill_src / "scripts").mkdir(parents=True)
+        (skill_src / SKILL_MARKER).write_text("---\nname: commit\n---\n# Commit")
+        (skill_src / "scripts" / "run.sh").write_text("echo hi")
+        monkeypatch.setattr(
+            "agr.fetcher.downloaded_repo",
+            lambda username, repo_name: nullcontext(skill_src.parent),
+        )
+        handle = ParsedHandle(username="user", repo="repo", name="commit")
+
+        results = fetch_and_install_to_tools(handle, repo_root, [CLAUDE, CURSOR])
+
+        source_script = skill_src / "scripts" / "run.sh"
+        claude_script = results["claude"] / "scripts" / "run.sh"
+        cursor_script = results["cursor"] / "scripts" / "run.sh"
+        assert claude_script.samefile(source_script)
+        assert not cursor_script.samefile(claude_script)
+        assert cursor_script.read_text() == "echo hi"
+        for installed in results.values():
+            assert not (installed / SKILL_MARKER).samefile(skill_src / SKILL_MARKER)
+        assert "name: commit\n" in (skill_src / SKILL_MARKER).read_text()
+        assert (
+            "name: user--repo--commit" in (results["claude"] / SKILL_MARKER).read_text()
+        )
+
+    def test_provided_repo_dir_is_copied_not_linked(self, repo_root, tmp_path):
+        """A shared extraction may be installed again, so nothing links to it."""
+        skill_src = tmp_path / "repo-main" / "commit"
+        skill_src.mkdir(parents=True)
+        (skill_src / SKILL_MARKER).write_text("# Commit")
+        (skill_src / "run.sh").write_text("echo hi")
+        handle = ParsedHandle(username="user", repo="repo", name="commit")
+
+        results = fetch_and_install_to_tools(
+            handle, repo_root, [CLAUDE], repo_dir=skill_src.parent
+        )
+
+        assert not (results["claude"] / "run.sh").samefile(skill_src / "run.sh")
+
+    @respx.mock(assert_all_mocked=True)
+    def test_unwritable_target_fails_before_download(self, repo_root, monkeypatch):
+        """An unwritable skills directory is reported without downloading."""
+        monkeypatch.setattr("agr.fetcher.ensure_writable", _deny_writes)
+        handle = ParsedHandle(username="user", repo="repo", name="commit")
+
+        with pytest.raises(InstallPermissionError, match="permission denied"):
+            fetch_and_install_to_tools(handle, repo_root, [CLAUDE])
+
+        assert not respx.calls
+        assert not (repo_root / ".claude").exists()
+
+    def test_unwritable_local_target_creates_nothing(
+        self, repo_root, skill_fixture, monkeypatch
+    ):
+        """Local installs also check writability before creating directories."""
+        monkeypatch.setattr("agr.fetcher.ensure_writable", _deny_writes)
+        handle = ParsedHandle(
+            is_local=True, name=skill_fixture.name, local_path=skill_fixture
+        )
+
+        with pytest.raises(InstallPermissionError):
+            fetch_and_install_to_tools(handle, repo_root, [CLAUDE])
+
+        assert not (repo_root / ".claude").exists()
+
+    @pytest.mark.skipif(
+        sys.platform == "win32" or os.geteuid() == 0,
+        reason="needs POSIX permissions that apply to the current user",
+    )
+    def test_ensure_writable_checks_nearest_existing_parent(self, tmp_path):
+        """A missing directory under a read-only parent is reported."""
+        read_only = tmp_path / "read-only"
+        read_only.mkdir()
+        read_only.chmod(0o500)
+        try:
+            with pytest.raises(InstallPermissionError, match="permission denied"):
+                ensure_writable(read_only / ".claude" / "skills")
+        finally:
+            read_only.chmod(0o700)
@@ -1,5 +1,8 @@
 """Tests for agr.handle module."""
 
+import dataclasses
+from pathlib import Path
+
 import pytest
 
 from agr.exceptions import InvalidHandleError
@@ -31,6 +34,13 @@ class TestParseHandle:
         assert h.is_remote
         assert not h.is_local
 
+    def test_remote_parse_is_cached(self):
+        """Repeated parses of a remote handle return the same frozen object."""
+        h = parse_handle("kasperjunge/commit")
+        assert parse_handle(" kasperjunge/commit ") is h
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            h.name = "other"  # type: ignore[misc]
+
     def test_local_dot_slash(self):
         """Parse ./path format as local."""
         h = parse_handle("./my-skill")
@@ -65,6 +75,44 @@ class TestParseHandle:
         with pytest.raises(InvalidHandleError):
             parse_handle("a/b/c/d")
 
+    @pytest.mark.parametrize(
+        "ref",
+        [
+            "user/",
+            "user//skill",
+            "user/my skill",
+            "user/skill\nname",
+            "user\x00/skill",
+            "-user/skill",
+            "üser/skill",
+            "user/" + "a" * 101,
+            "u" * 40 + "/skill",
+            "user/..",
+            "user/./x",
+            "user/../x",
+            "user/...",
+        ],
+        ids=[
+            "empty-name",
+            "empty-repo",
+            "space",
+            "newline",
+            "null-byte",
+            "leading-hyphen",
+            "non-ascii",
+            "name-too-long",
+            "username-too-long",
+            "dotdot-name",
+            "dot-repo",
+            "dotdot-repo",
+            "dots-only-name",
+        ],
+    )
+    def test_malformed_remote_handle_raises(self, ref):
+        """Remote handles outside GitHub's name rules are rejected up front."""
+        with pytest.raises(InvalidHandleError, match="expected user/name"):
+            parse_handle(ref)
+
     def test_parse_handle_rejects_double_hyphen_in_username(self):
         """Username containing -- raises error."""
         with pytest.raises(InvalidHandleError, match="contains reserved sequence"):
@@ -104,61 +152,70 @@ class TestParseHandle:
 class TestParsedHandle:
     """Tests for ParsedHandle methods."""
 
-    def test_to_toml_handle_simple(self):
-        """to_toml_handle for user/skill."""
-        h = ParsedHandle(username="kasperjunge", name="commit")
-        assert h.to_toml_handle() == "kasperjunge/commit"
-
-    def test_to_toml_handle_with_repo(self):
-        """to_toml_handle for user/repo/skill."""
-        h = ParsedHandle(username="maragudk", repo="skills", name="collaboration")
-        assert h.to_toml_handle() == "maragudk/skills/collaboration"
-
-    def test_to_toml_handle_local(self):
-        """to_toml_handle for local path."""
-        from pathlib import Path
-
-        # Path("./my-skill") normalizes to "my-skill"
-        h = ParsedHandle(is_local=True, name="my-skill", local_path=Path("./my-skill"))
-        assert h.to_toml_handle() == "my-skill"
-
-    def test_to_toml_handle_local_with_subdir(self):
-        """to_toml_handle for local path with subdirectory."""
-        from pathlib import Path
-
-        h = ParsedHandle(
-            is_local=True, name="skill", local_path=Path("./path/to/skill")
-        )
-        assert h.to_toml_handle() == "path/to/skill"
-
-    def test_to_installed_name_simple(self):
-        """to_installed_name for user/skill."""
-        h = ParsedHandle(username="kasperjunge", name="commit")
-        assert h.to_installed_name() == "kasperjunge--commit"
-
-    def test_to_installed_name_with_repo(self):
-        """to_installed_name for user/repo/skill."""
-        h = ParsedHandle(username="maragudk", repo="skills", name="collaboration")
-        assert h.to_installed_name() == "maragudk--skills--collaboration"
-
-    def test_to_installed_name_local(self):
-        """to_installed_name for local skill."""
-        h = ParsedHandle(is_local=True, name="my-skill")
-        assert h.to_installed_name() == "local--my-skill"
-
-    def test_get_github_repo_simple(self):
-        """get_github_repo for user/skill defaults repo."""
-        h = ParsedHandle(username="kasperjunge", name="commit")
-        user, repo = h.get_github_repo()
-        assert user == "kasperjunge"
-        assert repo == "agent-resources"
-
-    def test_get_github_repo_explicit(self):
-        """get_github_repo with explicit repo."""
-        h = ParsedHandle(username="maragudk", repo="skills", name="collaboration")
-        user, repo = h.get_github_repo()
-        assert user == "maragudk"
-        assert repo == "skills"
+    @pytest.mark.parametrize(
+        "handle,expected",
+        [
+            (ParsedHandle(username="kasperjunge", name="commit"), "kasperjunge/commit"),
+            (
+                ParsedHandle(username="maragudk", repo="skills", name="collaboration"),
+                "maragudk/skills/collaboration",
+            ),
+            # Path("./my-skill") normalizes to "my-skill"
+            (
+                ParsedHandle(
+                    is_local=True, name="my-skill", local_path=Path("./my-skill")
+                ),
+                "my-skill",
+            ),
+            (
+                ParsedHandle(
+                    is_local=True, name="skill", local_path=Path("./path/to/skill")
+                ),
+                "path/to/skill",
+            ),
+        ],
+        ids=["simple", "with-repo", "local", "local-subdir"],
+    )
+    def test_to_toml_handle(self, handle, expected):
+        """to_toml_handle gives the agr.toml form of remote and local handles."""
+        assert handle.to_toml_handle() == expected
+
+    @pytest.mark.parametrize(
+        "handle,expected",
+        [
+            (
+                ParsedHandle(username="kasperjunge", name="commit"),
+                "kasperjunge--commit",
+            ),
+            (
+                ParsedHandle(username="maragudk", repo="skills", name="collaboration"),
+                "maragudk--skills--collaboration",
+            ),
+            (ParsedHandle(is_local=True, name="my-skill"), "local--my-skill"),
+        ],
+        ids=["simple", "with-repo", "local"],
+    )
+    def test_to_installed_name(self, handle, expected):
+        """to_installed_name joins handle parts with the separator."""
+        assert handle.to_installed_name() == expected
+
+    @pytest.mark.parametrize(
+        "handle,expected",
+        [
+            (
+                ParsedHandle(username="kasperjunge", name="commit"),
+                ("kasperjunge", "agent-resources"),
+            ),
+            (
+                ParsedHandle(username="maragudk", repo="skills", name="collaboration"),
+                ("maragudk", "skills"),
+            ),
+        ],
+        ids=["default-repo", "explicit-repo"],
+    )
+    def test_get_github_repo(self, handle, expected):
+        """get_github_repo defaults the repo to agent-resources."""
+        assert handle.get_github_repo() == expected
 
     def test_get_github_repo_local_raises(self):
         """get_github_repo for local handle raises."""
@@ -170,40 +227,19 @@ class TestParsedHandle:
 class TestInstalledNameToTomlHandle:
     """Tests for installed_name_to_toml_handle function."""
 
-    def test_simple(self):
-        """Convert kasperjunge--commit to kasperjunge/commit."""
-        assert (
-            installed_name_to_toml_handle("kasperjunge--commit") == "kasperjunge/commit"
-        )
-
-    def test_with_repo(self):
-        """Convert maragudk--skills--collaboration to maragudk/skills/collaboration."""
-        assert (
-            installed_name_to_toml_handle("maragudk--skills--collaboration")
-            == "maragudk/skills/collaboration"
-        )
-
-    def test_local(self):
-        """Convert local--my-skill to my-skill."""
-        assert installed_name_to_toml_handle("local--my-skill") == "my-skill"
-
-    def test_no_separator(self):
-        """Handle without separator returns as-is."""
-        assert installed_name_to_toml_handle("simple") == "simple"
-
-    def test_legacy_colon_simple(self):
-        """Backward compatibility: colon format still parses (user:skill)."""
-        assert (
-            installed_name_to_toml_handle("kasperjunge:commit") == "kasperjunge/commit"
-        )
-
-    def test_legacy_colon_with_repo(self):
-        """Backward compatibility: colon format still parses (user:repo:skill)."""
-        assert (
-            installed_name_to_toml_handle("maragudk:skills:collaboration")
-            == "maragudk/skills/collaboration"
-        )
-
-    def test_legacy_colon_local(self):
-        """Backward compatibility: colon format still parses (local:skill)."""
-        assert installed_name_to_toml_handle("local:my-skill") == "my-skill"
+    @pytest.mark.parametrize(
+        "installed_name,expected",
+        [
+            ("kasperjunge--commit", "kasperjunge/commit"),
+            ("maragudk--skills--collaboration", "maragudk/skills/collaboration"),
+            ("local--my-skill", "my-skill"),
+            ("simple", "simple"),
+            # Backward compatibility: legacy colon format still parses
+            ("kasperjunge:commit", "kasperjunge/commit"),
+            ("maragudk:skills:collaboration", "maragudk/skills/collaboration"),
+            ("local:my-skill", "my-skill"),
+        ],
+    )
+    def test_converts_installed_name(self, installed_name, expected):
+        """Installed directory names map back to their agr.toml handle."""
+        assert installed_name_to_toml_handle(installed_name) == expected
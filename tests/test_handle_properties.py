@@ -0,0 +1,46 @@
+"""Property-based tests for agr.handle round trips."""
+
+import pytest
+
+pytest.importorskip("hypothesis")
+
+from hypothesis import given  # noqa: E402
+from hypothesis import strategies as st  # noqa: E402
+
+from agr.handle import (  # noqa: E402
+    LOCAL_PREFIX,
+    installed_name_to_toml_handle,
+    parse_handle,
+)
+
+# A GitHub-style name segment: no leading, trailing or doubled hyphens, so
+# joining segments with "--" can't create an ambiguous installed name
+segment = st.from_regex(r"[a-z0-9]{1,10}(?:-[a-z0-9]{1,10}){0,2}", fullmatch=True)
+# A remote user named "local" installs as "local--name", which reads back as
+# a local skill; that lossy case is pinned separately below
+remote_handle = (
+    st.lists(segment, min_size=2, max_size=3)
+    .filter(lambda parts: parts[0] != LOCAL_PREFIX)
+    .map("/".join)
+)
+
+
+class TestHandleRoundTrip:
+    """Installed names convert back to the handle they came from."""
+
+    @given(remote_handle)
+    def test_remote_round_trip(self, handle):
+        """user/name and user/repo/name survive install-name conversion."""
+        installed_name = parse_handle(handle).to_installed_name()
+        assert installed_name_to_toml_handle(installed_name) == handle
+
+    @given(segment)
+    def test_local_round_trip(self, name):
+        """Local installed names convert back to the bare skill name."""
+        installed_name = parse_handle(f"./{name}").to_installed_name()
+        assert installed_name_to_toml_handle(installed_name) == name
+
+    def test_remote_user_named_local_reads_back_as_local(self):
+        """Documented lossy case: user "local" collides with the local prefix."""
+        installed_name = parse_handle("local/foo").to_installed_name()
+        assert installed_name_to_toml_handle(installed_name) == "foo"
@@ -1,5 +1,7 @@
 """Tests for agr.skill module."""
 
+import os
+
 import pytest
 
 from agr.skill import (
@@ -11,71 +13,65 @@ from agr.skill import (
     update_skill_md_name,
     validate_skill_name,
 )
+from tests.helpers import make_tree
+
+# SKILL.md contents reused across tests
+NAMED_SKILL_MD = b"---\nname: old-name\n---\n\n# Content\n"
+UNNAMED_SKILL_MD = b"---\ndescription: A skill\n---\n\n# Content\n"
+
+
+@pytest.fixture(scope="module")
+def skill_tree(tmp_path_factory):
+    """Read-only layout shared by the is_valid_skill_dir tests."""
+    root = tmp_path_factory.mktemp("skill_tree")
+    (root / "my-skill").mkdir()
+    (root / "my-skill" / SKILL_MARKER).touch()
+    (root / "empty-skill").mkdir()
+    (root / "file.txt").touch()
+    return root
 
 
 class TestIsValidSkillDir:
     """Tests for is_valid_skill_dir function."""
 
-    def test_valid_skill(self, tmp_path):
+    def test_valid_skill(self, skill_tree):
         """Directory with SKILL.md is valid."""
-        skill_dir = tmp_path / "my-skill"
-        skill_dir.mkdir()
-        (skill_dir / SKILL_MARKER).write_text("# Skill")
-        assert is_valid_skill_dir(skill_dir)
+        assert is_valid_skill_dir(skill_tree / "my-skill")
 
-    def test_missing_marker(self, tmp_path):
+    def test_missing_marker(self, skill_tree):
         """Directory without SKILL.md is not valid."""
-        skill_dir = tmp_path / "my-skill"
-        skill_dir.mkdir()
-        assert not is_valid_skill_dir(skill_dir)
+        assert not is_valid_skill_dir(skill_tree / "empty-skill")
 
-    def test_file_not_dir(self, tmp_path):
+    def test_file_not_dir(self, skill_tree):
         """File is not valid."""
-        file_path = tmp_path / "file.txt"
-        file_path.write_text("content")
-        assert not is_valid_skill_dir(file_path)
+        assert not is_valid_skill_dir(skill_tree / "file.txt")
 
-    def test_nonexistent(self, tmp_path):
+    def test_nonexistent(self, skill_tree):
         """Nonexistent path is not valid."""
-        assert not is_valid_skill_dir(tmp_path / "nonexistent")
+        assert not is_valid_skill_dir(skill_tree / "nonexistent")
 
 
 class TestValidateSkillName:
     """Tests for validate_skill_name function."""
 
-    def test_valid_simple(self):
-        """Simple alphanumeric name is valid."""
-        assert validate_skill_name("commit")
-
-    def test_valid_with_hyphen(self):
-        """Name with hyphens is valid."""
-        assert validate_skill_name("my-skill")
-
-    def test_valid_with_underscore(self):
-        """Name with underscores is valid."""
-        assert validate_skill_name("my_skill")
-
-    def test_valid_with_numbers(self):
-        """Name with numbers is valid."""
-        assert validate_skill_name("skill123")
-
-    def test_invalid_empty(self):
-        """Empty name is invalid."""
-        assert not validate_skill_name("")
-
-    def test_invalid_starts_with_hyphen(self):
-        """Name starting with hyphen is invalid."""
-        assert not validate_skill_name("-skill")
-
-    def test_invalid_starts_with_number(self):
-        """Name starting with number is valid (alphanumeric)."""
-        # Actually this should be valid per the regex
-        assert validate_skill_name("1skill")
-
-    def test_invalid_special_chars(self):
-        """Name with special characters is invalid."""
-        assert not validate_skill_name("skill!")
-        assert not validate_skill_name("skill@name")
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            ("commit", True),
+            ("my-skill", True),
+            ("my_skill", True),
+            ("skill123", True),
+            ("1skill", True),
+            ("", False),
+            ("-skill", False),
+            ("_skill", False),
+            ("skill!", False),
+            ("skill@name", False),
+        ],
+    )
+    def test_validate_name(self, name, expected):
+        """Names must be alphanumeric with hyphens/underscores, not leading."""
+        assert validate_skill_name(name) is expected
 
 
 class TestUpdateSkillMdName:
@@ -86,12 +82,7 @@ class TestUpdateSkillMdName:
         skill_dir = tmp_path / "my-skill"
         skill_dir.mkdir()
         skill_md = skill_dir / SKILL_MARKER
-        skill_md.write_text("""---
-name: old-name
----
-
-# Content
-""")
+        skill_md.write_bytes(NAMED_SKILL_MD)
         update_skill_md_name(skill_dir, "new-name")
         content = skill_md.read_text()
         assert "name: new-name" in content
@@ -102,12 +93,7 @@ name: old-name
         skill_dir = tmp_path / "my-skill"
         skill_dir.mkdir()
         skill_md = skill_dir / SKILL_MARKER
-        skill_md.write_text("""---
-description: A skill
----
-
-# Content
-""")
+        skill_md.write_bytes(UNNAMED_SKILL_MD)
         update_skill_md_name(skill_dir, "new-name")
         content = skill_md.read_text()
         assert "name: new-name" in content
@@ -165,108 +151,128 @@ class TestCreateSkillScaffold:
             create_skill_scaffold("existing", tmp_path)
 
 
+@pytest.fixture(scope="module")
+def populated_repo(tmp_path_factory):
+    """Read-only repo layout shared by lookup tests that only vary the query."""
+    root = tmp_path_factory.mktemp("populated_repo")
+    make_tree(
+        root,
+        {
+            f"my-skill/{SKILL_MARKER}": b"# Shallow",
+            f"nested/dir/my-skill/{SKILL_MARKER}": b"# Deep",
+            f"actual-skill/{SKILL_MARKER}": b"# Skill",
+            f"skills/commit/{SKILL_MARKER}": b"# Skill",
+        },
+    )
+    return root
+
+
 class TestFindSkillInRepo:
     """Tests for find_skill_in_repo function."""
 
-    def test_finds_skill_at_root(self, tmp_path):
-        """Finds skill directory at repo root."""
-        skill_dir = tmp_path / "my-skill"
-        skill_dir.mkdir()
-        (skill_dir / SKILL_MARKER).write_text("# Skill")
+    @pytest.mark.parametrize(
+        "rel_path",
+        [
+            "my-skill",
+            "skills/my-skill",
+            "resources/custom/skills/my-skill",
+        ],
+        ids=["root", "skills-dir", "deeply-nested"],
+    )
+    def test_finds_skill_at_depth(self, tmp_path, rel_path):
+        """Finds skill directories at any depth in the repo."""
+        skill_dir = tmp_path / rel_path
+        make_tree(skill_dir, {SKILL_MARKER: b"# Skill"})
 
         result = find_skill_in_repo(tmp_path, "my-skill")
         assert result == skill_dir
 
-    def test_finds_skill_in_skills_dir(self, tmp_path):
-        """Finds skill in skills/ subdirectory."""
-        skills_dir = tmp_path / "skills" / "commit"
-        skills_dir.mkdir(parents=True)
-        (skills_dir / SKILL_MARKER).write_text("# Skill")
-
-        result = find_skill_in_repo(tmp_path, "commit")
-        assert result == skills_dir
-
-    def test_finds_skill_deeply_nested(self, tmp_path):
-        """Finds skill in deeply nested directory."""
-        nested = tmp_path / "resources" / "custom" / "skills" / "deep-skill"
-        nested.mkdir(parents=True)
-        (nested / SKILL_MARKER).write_text("# Skill")
-
-        result = find_skill_in_repo(tmp_path, "deep-skill")
-        assert result == nested
-
-    def test_returns_none_when_not_found(self, tmp_path):
+    def test_returns_none_when_not_found(self, populated_repo):
         """Returns None when skill not found."""
-        result = find_skill_in_repo(tmp_path, "nonexistent")
-        assert result is None
-
-    def test_excludes_git_directory(self, tmp_path):
-        """Excludes .git directory from search."""
-        git_skill = tmp_path / ".git" / "hooks" / "my-skill"
-        git_skill.mkdir(parents=True)
-        (git_skill / SKILL_MARKER).write_text("# Skill")
-
-        result = find_skill_in_repo(tmp_path, "my-skill")
-        assert result is None
-
-    def test_excludes_node_modules(self, tmp_path):
-        """Excludes node_modules directory from search."""
-        node_skill = tmp_path / "node_modules" / "some-package" / "my-skill"
-        node_skill.mkdir(parents=True)
-        (node_skill / SKILL_MARKER).write_text("# Skill")
-
-        result = find_skill_in_repo(tmp_path, "my-skill")
+        result = find_skill_in_repo(populated_repo, "nonexistent")
         assert result is None
 
-    def test_excludes_pycache(self, tmp_path):
-        """Excludes __pycache__ directory from search."""
-        cache_skill = tmp_path / "__pycache__" / "my-skill"
-        cache_skill.mkdir(parents=True)
-        (cache_skill / SKILL_MARKER).write_text("# Skill")
+    @pytest.mark.parametrize(
+        "rel_path",
+        [
+            ".git/hooks/my-skill",
+            "node_modules/some-package/my-skill",
+            "__pycache__/my-skill",
+            ".venv/lib/my-skill",
+            "venv/lib/my-skill",
+        ],
+        ids=[".git", "node_modules", "__pycache__", ".venv", "venv"],
+    )
+    def test_excludes_directory(self, tmp_path, rel_path):
+        """Skills inside excluded directories are not found."""
+        excluded_skill = tmp_path / rel_path
+        make_tree(excluded_skill, {SKILL_MARKER: b"# Skill"})
 
         result = find_skill_in_repo(tmp_path, "my-skill")
         assert result is None
 
-    def test_excludes_venv(self, tmp_path):
-        """Excludes .venv and venv directories from search."""
-        for venv_name in [".venv", "venv"]:
-            venv_skill = tmp_path / venv_name / "lib" / "my-skill"
-            venv_skill.mkdir(parents=True)
-            (venv_skill / SKILL_MARKER).write_text("# Skill")
-
-        result = find_skill_in_repo(tmp_path, "my-skill")
-        assert result is None
+    def test_does_not_descend_into_excluded_dirs(self, tmp_path, monkeypatch):
+        """Excluded directories are pruned from the walk, not post-filtered."""
+        make_tree(
+            tmp_path,
+            {
+                f"node_modules/pkg{i}/deep/skill{i}/{SKILL_MARKER}": b""
+                for i in range(50)
+            },
+        )
+        scanned = []
+        real_scandir = os.scandir
+
+        def recording_scandir(path):
+            scanned.append(os.fspath(path))
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", recording_scandir)
+
+        assert find_skill_in_repo(tmp_path, "skill0") is None
+        assert scanned == [os.fspath(tmp_path)]
+
+    def test_top_level_match_skips_walk(self, tmp_path, monkeypatch):
+        """A skill directly under the repo root is found without scanning."""
+        make_tree(
+            tmp_path,
+            {
+                f"my-skill/{SKILL_MARKER}": b"# Skill",
+                f"other/my-skill/{SKILL_MARKER}": b"# Skill",
+            },
+        )
+        monkeypatch.setattr(os, "scandir", pytest.fail)
+
+        assert find_skill_in_repo(tmp_path, "my-skill") == tmp_path / "my-skill"
+
+    @pytest.mark.parametrize("name", ["..", ".", ""])
+    def test_relative_names_do_not_escape_repo(self, tmp_path, name):
+        """Path-like skill names never resolve outside or to the repo itself."""
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        make_tree(
+            tmp_path, {SKILL_MARKER: b"# Skill", f"repo/{SKILL_MARKER}": b"# Skill"}
+        )
+
+        assert find_skill_in_repo(repo, name) is None
 
     def test_excludes_root_level_skill_md(self, tmp_path):
         """Excludes SKILL.md at repo root (not in a subdirectory)."""
         # Create a SKILL.md directly in repo root
-        (tmp_path / SKILL_MARKER).write_text("# Root skill")
+        (tmp_path / SKILL_MARKER).touch()
 
         # The repo dir name itself might match, but should be excluded
         result = find_skill_in_repo(tmp_path, tmp_path.name)
         assert result is None
 
-    def test_prefers_shallowest_match(self, tmp_path):
+    def test_prefers_shallowest_match(self, populated_repo):
         """Returns shallowest match when duplicates exist."""
-        # Create skill at two depths
-        shallow = tmp_path / "my-skill"
-        shallow.mkdir()
-        (shallow / SKILL_MARKER).write_text("# Shallow")
-
-        deep = tmp_path / "nested" / "dir" / "my-skill"
-        deep.mkdir(parents=True)
-        (deep / SKILL_MARKER).write_text("# Deep")
+        result = find_skill_in_repo(populated_repo, "my-skill")
+        assert result == populated_repo / "my-skill"
 
-        result = find_skill_in_repo(tmp_path, "my-skill")
-        assert result == shallow
-
-    def test_requires_directory_name_match(self, tmp_path):
+    def test_requires_directory_name_match(self, populated_repo):
         """Only matches when directory name equals skill name."""
-        skill_dir = tmp_path / "actual-skill"
-        skill_dir.mkdir()
-        (skill_dir / SKILL_MARKER).write_text("# Skill")
-
-        result = find_skill_in_repo(tmp_path, "other-name")
+        result = find_skill_in_repo(populated_repo, "other-name")
         assert result is None
 
 
@@ -276,8 +282,7 @@ class TestDiscoverSkillsInRepo:
     def test_discovers_single_skill(self, tmp_path):
         """Discovers a single skill."""
         skill_dir = tmp_path / "my-skill"
-        skill_dir.mkdir()
-        (skill_dir / SKILL_MARKER).write_text("# Skill")
+        make_tree(skill_dir, {SKILL_MARKER: b"# Skill"})
 
         result = discover_skills_in_repo(tmp_path)
         assert len(result) == 1
@@ -285,10 +290,13 @@ class TestDiscoverSkillsInRepo:
 
     def test_discovers_multiple_skills(self, tmp_path):
         """Discovers multiple skills."""
-        for name in ["alpha", "beta", "gamma"]:
-            skill_dir = tmp_path / name
-            skill_dir.mkdir()
-            (skill_dir / SKILL_MARKER).write_text(f"# {name}")
+        make_tree(
+            tmp_path,
+            {
+                f"{name}/{SKILL_MARKER}": f"# {name}".encode()
+                for name in ["alpha", "beta", "gamma"]
+            },
+        )
 
         result = discover_skills_in_repo(tmp_path)
         assert len(result) == 3
@@ -298,8 +306,7 @@ class TestDiscoverSkillsInRepo:
     def test_discovers_nested_skills(self, tmp_path):
         """Discovers skills in nested directories."""
         nested = tmp_path / "resources" / "skills" / "nested-skill"
-        nested.mkdir(parents=True)
-        (nested / SKILL_MARKER).write_text("# Nested")
+        make_tree(nested, {SKILL_MARKER: b"# Nested"})
 
         result = discover_skills_in_repo(tmp_path)
         assert len(result) == 1
@@ -313,8 +320,7 @@ class TestDiscoverSkillsInRepo:
     def test_excludes_git_directory(self, tmp_path):
         """Excludes .git directory from discovery."""
         git_skill = tmp_path / ".git" / "my-skill"
-        git_skill.mkdir(parents=True)
-        (git_skill / SKILL_MARKER).write_text("# Skill")
+        make_tree(git_skill, {SKILL_MARKER: b"# Skill"})
 
         result = discover_skills_in_repo(tmp_path)
         assert result == []
@@ -322,8 +328,7 @@ class TestDiscoverSkillsInRepo:
     def test_excludes_node_modules(self, tmp_path):
         """Excludes node_modules from discovery."""
         node_skill = tmp_path / "node_modules" / "pkg" / "my-skill"
-        node_skill.mkdir(parents=True)
-        (node_skill / SKILL_MARKER).write_text("# Skill")
+        make_tree(node_skill, {SKILL_MARKER: b"# Skill"})
 
         result = discover_skills_in_repo(tmp_path)
         assert result == []
@@ -331,26 +336,29 @@ class TestDiscoverSkillsInRepo:
     def test_deduplicates_by_name(self, tmp_path):
         """Returns only one entry per skill name."""
         # Create same skill name at two locations
-        shallow = tmp_path / "my-skill"
-        shallow.mkdir()
-        (shallow / SKILL_MARKER).write_text("# Shallow")
-
-        deep = tmp_path / "nested" / "my-skill"
-        deep.mkdir(parents=True)
-        (deep / SKILL_MARKER).write_text("# Deep")
+        make_tree(
+            tmp_path,
+            {
+                f"my-skill/{SKILL_MARKER}": b"# Shallow",
+                f"nested/my-skill/{SKILL_MARKER}": b"# Deep",
+            },
+        )
 
         result = discover_skills_in_repo(tmp_path)
         assert len(result) == 1
         assert result[0][0] == "my-skill"
         # Should prefer shallowest
-        assert result[0][1] == shallow
+        assert result[0][1] == tmp_path / "my-skill"
 
     def test_results_sorted_alphabetically(self, tmp_path):
         """Results are sorted by skill name."""
-        for name in ["zebra", "apple", "mango"]:
-            skill_dir = tmp_path / name
-            skill_dir.mkdir()
-            (skill_dir / SKILL_MARKER).write_text(f"# {name}")
+        make_tree(
+            tmp_path,
+            {
+                f"{name}/{SKILL_MARKER}": f"# {name}".encode()
+                for name in ["zebra", "apple", "mango"]
+            },
+        )
 
         result = discover_skills_in_repo(tmp_path)
         names = [name for name, _ in result]
@@ -358,23 +366,23 @@ class TestDiscoverSkillsInRepo:
 
     def test_excludes_root_level_skill_md(self, tmp_path):
         """Excludes SKILL.md directly at repo root."""
-        (tmp_path / SKILL_MARKER).write_text("# Root")
+        (tmp_path / SKILL_MARKER).touch()
 
         result = discover_skills_in_repo(tmp_path)
         assert result == []
 
     def test_mixed_valid_and_excluded(self, tmp_path):
         """Discovers valid skills while excluding invalid locations."""
-        # Valid skill
-        valid = tmp_path / "valid-skill"
-        valid.mkdir()
-        (valid / SKILL_MARKER).write_text("# Valid")
-
-        # Excluded locations
-        for excluded in [".git/hooks/git-skill", "node_modules/pkg/node-skill"]:
-            excluded_dir = tmp_path / excluded
-            excluded_dir.mkdir(parents=True)
-            (excluded_dir / SKILL_MARKER).write_text("# Excluded")
+        make_tree(
+            tmp_path,
+            {
+                # Valid skill
+                f"valid-skill/{SKILL_MARKER}": b"# Valid",
+                # Excluded locations
+                f".git/hooks/git-skill/{SKILL_MARKER}": b"# Excluded",
+                f"node_modules/pkg/node-skill/{SKILL_MARKER}": b"# Excluded",
+            },
+        )
 
         result = discover_skills_in_repo(tmp_path)
         assert len(result) == 1
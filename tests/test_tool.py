@@ -1,5 +1,10 @@
 """Tests for agr.tool module."""
 
+import dataclasses
+
+import pytest
+
+from agr.exceptions import AgrError
 from agr.tool import CLAUDE, COPILOT, CURSOR, TOOLS, get_tool
 
 
@@ -35,16 +40,20 @@ class TestToolConfig:
         assert CURSOR.install_hint is not None
         assert COPILOT.install_hint is not None
 
-    def test_all_tools_have_cli_config(self):
+    @pytest.mark.parametrize("tool_config", TOOLS.values(), ids=TOOLS.keys())
+    def test_all_tools_have_cli_config(self, tool_config):
         """All registered tools have CLI configuration."""
-        for name, tool_config in TOOLS.items():
-            assert tool_config.cli_command is not None, f"{name} missing cli_command"
-            assert tool_config.cli_prompt_flag, f"{name} missing cli_prompt_flag"
-            assert tool_config.cli_force_flag is not None, (
-                f"{name} missing cli_force_flag"
-            )
-            assert tool_config.cli_continue_flag, f"{name} missing cli_continue_flag"
-            assert tool_config.install_hint is not None, f"{name} missing install_hint"
+        assert tool_config.cli_command is not None
+        assert tool_config.cli_prompt_flag
+        assert tool_config.cli_force_flag is not None
+        assert tool_config.cli_continue_flag
+        assert tool_config.install_hint is not None
+
+    @pytest.mark.parametrize("tool_config", TOOLS.values(), ids=TOOLS.keys())
+    def test_tool_config_is_frozen(self, tool_config):
+        """ToolConfig instances reject attribute assignment."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            tool_config.name = "changed"
 
 
 class TestGetTool:
@@ -58,9 +67,5 @@ class TestGetTool:
 
     def test_get_tool_unknown_raises(self):
         """get_tool raises AgrError for unknown tool."""
-        import pytest
-
-        from agr.exceptions import AgrError
-
         with pytest.raises(AgrError, match="Unknown tool"):
             get_tool("unknown-tool")